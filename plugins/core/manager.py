@@ -7,7 +7,7 @@ import inspect
 import pkgutil
 import importlib
 import logging
-from typing import Dict, List, Type, Optional, Any, Set
+from typing import AbstractSet, Dict, List, Type, Optional, Any, Set
 
 from .base import PluginInterface, PluginError
 
@@ -25,6 +25,20 @@ class PluginManager:
         """
         self._plugins: Dict[str, PluginInterface] = {}
         self._plugin_directories: List[str] = []
+        self._version = 0
+    
+    @property
+    def version(self) -> int:
+        """
+        Get the plugin state version.
+        
+        The version is incremented whenever a plugin is loaded, unloaded,
+        enabled or disabled, so callers can cheaply detect state changes.
+        
+        Returns:
+            int: The current plugin state version.
+        """
+        return self._version
         
     def register_plugin_directory(self, directory: str) -> None:
         """
@@ -39,10 +53,15 @@ class PluginManager:
         else:
             logger.warning(f"Plugin directory not found or already registered: {directory}")
     
-    def discover_plugins(self) -> Dict[str, Type[PluginInterface]]:
+    def discover_plugins(
+        self, exclude: Optional[AbstractSet[str]] = None
+    ) -> Dict[str, Type[PluginInterface]]:
         """
         Discover all available plugins in the registered directories.
         
+        Args:
+            exclude (Optional[AbstractSet[str]]): Plugin names to leave out of the result.
+            
         Returns:
             Dict[str, Type[PluginInterface]]: Dictionary of plugin names to plugin classes.
         """
@@ -75,6 +94,9 @@ class PluginManager:
                             try:
                                 instance = item()
                                 plugin_name = instance.name
+                                if exclude and plugin_name in exclude:
+                                    logger.debug(f"Skipping excluded plugin: {plugin_name}")
+                                    continue
                                 discovered_plugins[plugin_name] = item
                                 logger.info(f"Discovered plugin: {plugin_name} ({item.__name__})")
                             except Exception as e:
@@ -97,6 +119,18 @@ class PluginManager:
         Returns:
             bool: True if the plugin was loaded successfully, False otherwise.
         """
+        return self.load_plugin_instance(plugin_class) is not None
+    
+    def load_plugin_instance(self, plugin_class: Type[PluginInterface]) -> Optional[PluginInterface]:
+        """
+        Load a plugin and return the instance that was loaded.
+        
+        Args:
+            plugin_class (Type[PluginInterface]): The plugin class to load.
+            
+        Returns:
+            Optional[PluginInterface]: The loaded plugin instance, or None if loading failed.
+        """
         try:
             # Create an instance of the plugin
             plugin_instance = plugin_class()
@@ -105,7 +139,7 @@ class PluginManager:
             # Check if the plugin is already loaded
             if plugin_name in self._plugins:
                 logger.warning(f"Plugin already loaded: {plugin_name}")
-                return False
+                return None
             
             # Initialize the plugin
             if not plugin_instance.initialize():
@@ -113,13 +147,14 @@ class PluginManager:
             
             # Register the plugin
             self._plugins[plugin_name] = plugin_instance
+            self._version += 1
             logger.info(f"Loaded plugin: {plugin_name} v{plugin_instance.version}")
             
-            return True
+            return plugin_instance
         
         except Exception as e:
             logger.error(f"Failed to load plugin: {str(e)}")
-            return False
+            return None
     
     def load_plugins(self, plugin_classes: Dict[str, Type[PluginInterface]]) -> Dict[str, bool]:
         """
@@ -230,6 +265,7 @@ class PluginManager:
             
             # Remove the plugin
             del self._plugins[plugin_name]
+            self._version += 1
             logger.info(f"Unloaded plugin: {plugin_name}")
             
             return True
@@ -293,6 +329,7 @@ class PluginManager:
             return False
         
         plugin.enabled = True
+        self._version += 1
         logger.info(f"Enabled plugin: {plugin_name}")
         return True
     
@@ -312,6 +349,7 @@ class PluginManager:
             return False
         
         plugin.enabled = False
+        self._version += 1
         logger.info(f"Disabled plugin: {plugin_name}")
         return True
     
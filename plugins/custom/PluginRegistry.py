@@ -7,16 +7,319 @@ plugins and the core application.
 """
 import logging
 import os
+import re
+import sys
 import json
 import time
+from collections import Counter
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Iterator, List, Any, Mapping, Optional, Pattern, Set, Tuple
 
-from myproject.plugins.core.base import BasePlugin
+from myproject.plugins.core.base import BasePlugin, PluginInterface
 from myproject.plugins.core.manager import plugin_manager
 
 logger = logging.getLogger(__name__)
 
+# Combined registry document, keyed by section
+REGISTRY_FILE = "registry.json"
+
+# Per-section files written by older versions of the registry
+LEGACY_REGISTRY_FILES = {
+    "metadata": "plugin_metadata.json",
+    "usage": "usage_stats.json",
+    "integration": "integration_points.json",
+    "hooks": "event_hooks.json"
+}
+
+# Category rules in priority order: (category, name pattern, description pattern)
+CATEGORY_PATTERNS: List[Tuple[str, Optional[Pattern[str]], Optional[Pattern[str]]]] = [
+    ("ui", re.compile(r"dashboard|ui"), re.compile(r"dashboard")),
+    ("logging", re.compile(r"log"), re.compile(r"logging")),
+    ("notification", re.compile(r"notification|alert"), re.compile(r"notification")),
+    ("integration", re.compile(r"integration"), re.compile(r"connect")),
+    ("security", re.compile(r"security|auth"), None),
+    ("data", re.compile(r"data|storage"), re.compile(r"database")),
+    ("utility", re.compile(r"util"), None)
+]
+
+# Method name fragments that indicate a plugin feature
+FEATURE_PATTERN = re.compile(
+    r"render|display|view|process|transform|convert|export|import"
+    r"|api|endpoint|route|auth|login|permission",
+    re.IGNORECASE
+)
+
+FEATURE_TAGS = {
+    "render": "ui",
+    "display": "ui",
+    "view": "ui",
+    "process": "data_processing",
+    "transform": "data_processing",
+    "convert": "data_processing",
+    "export": "data_exchange",
+    "import": "data_exchange",
+    "api": "api",
+    "endpoint": "api",
+    "route": "api",
+    "auth": "authentication",
+    "login": "authentication",
+    "permission": "authentication"
+}
+
+# Health statuses reported by get_health_summary
+HEALTH_STATUSES = ("healthy", "degraded", "disabled", "error", "unknown")
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dump_json(obj: Any) -> bytes:
+    """
+    Serialize an object to indented JSON bytes, using orjson when available.
+    
+    Args:
+        obj: The object to serialize.
+        
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _load_json(data: bytes) -> Any:
+    """
+    Deserialize JSON bytes, using orjson when available.
+    
+    Args:
+        data (bytes): The UTF-8 encoded JSON document.
+        
+    Returns:
+        Any: The deserialized object.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_file_atomic(path: str, data: bytes) -> None:
+    """
+    Write bytes to a file through a temporary file that atomically replaces it.
+    
+    The data is written with raw ``os.write`` calls (normally a single one)
+    rather than through a buffered file object.
+    
+    Args:
+        path (str): The destination file path.
+        data (bytes): The file contents.
+    """
+    temp_path = path + ".tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    
+    os.replace(temp_path, path)
+
+
+def _iter_public_attributes(plugin: Any) -> Iterator[Tuple[str, Any]]:
+    """
+    Iterate over the public attributes defined by a plugin.
+    
+    Scans the instance dictionary and the class dictionaries along the MRO,
+    stopping at the plugin framework base classes. Unlike ``dir()`` this
+    neither sorts the names nor binds a method for every attribute.
+    
+    Args:
+        plugin: The plugin instance.
+        
+    Yields:
+        Tuple[str, Any]: The attribute name and its raw (unbound) value.
+    """
+    seen: Set[str] = set()
+    namespaces = [getattr(plugin, "__dict__", {})]
+    
+    for cls in type(plugin).__mro__:
+        if cls in (BasePlugin, PluginInterface, object):
+            break
+        namespaces.append(cls.__dict__)
+    
+    for namespace in namespaces:
+        for attr_name, attr in namespace.items():
+            if attr_name.startswith("_") or attr_name in seen:
+                continue
+            
+            seen.add(attr_name)
+            yield attr_name, attr
+
+
+def _is_method(attr: Any) -> bool:
+    """
+    Check whether a raw attribute value from ``_iter_public_attributes`` is callable.
+    
+    Args:
+        attr: The attribute value.
+        
+    Returns:
+        bool: True if the attribute is callable on the plugin instance.
+    """
+    return callable(attr) or isinstance(attr, (staticmethod, classmethod))
+
+
+def _default_compatibility() -> Dict[str, Any]:
+    """
+    Get the default compatibility information for a newly registered plugin.
+    
+    Returns:
+        Dict[str, Any]: The compatibility information.
+    """
+    return {
+        "min_app_version": "1.0.0",
+        "max_app_version": None,
+        "platform_compatibility": ["all"]
+    }
+
+
+@dataclass(slots=True)
+class PluginMetadata:
+    """
+    Extended metadata the registry keeps for a plugin.
+    
+    Keys set through ``update`` that are not fields are kept in ``extra``.
+    """
+    name: str = ""
+    version: str = ""
+    description: str = ""
+    author: str = ""
+    dependencies: List[str] = field(default_factory=list)
+    first_registered: Optional[str] = None
+    last_updated: Optional[str] = None
+    category: str = "other"
+    features: List[str] = field(default_factory=list)
+    health_status: str = "unknown"
+    compatibility: Dict[str, Any] = field(default_factory=_default_compatibility)
+    last_health_check: Optional[str] = None
+    last_error: Optional[str] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+    
+    def update(self, values: Dict[str, Any]) -> None:
+        """
+        Update metadata values.
+        
+        Args:
+            values (Dict[str, Any]): The values to set, keyed by metadata name.
+        """
+        for key, value in values.items():
+            if key in _METADATA_FIELDS:
+                setattr(self, key, value)
+            else:
+                self.extra[key] = value
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the metadata to its serialized dictionary form.
+        
+        Returns:
+            Dict[str, Any]: The metadata as a flat dictionary.
+        """
+        data = {key: getattr(self, key) for key in _METADATA_FIELDS}
+        data.update(self.extra)
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PluginMetadata":
+        """
+        Create metadata from its serialized dictionary form.
+        
+        Args:
+            data (Dict[str, Any]): The metadata as a flat dictionary.
+            
+        Returns:
+            PluginMetadata: The metadata.
+        """
+        metadata = cls()
+        metadata.update(data)
+        return metadata
+
+
+@dataclass(slots=True)
+class UsageStats:
+    """
+    Usage statistics the registry keeps for a plugin.
+    
+    The average response time is kept in integer nanoseconds and
+    converted to seconds when serialized.
+    """
+    load_count: int = 0
+    initialization_time: float = 0
+    last_used: Optional[str] = None
+    usage_count: int = 0
+    error_count: int = 0
+    avg_response_time_ns: int = 0
+    samples: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the statistics to their serialized dictionary form.
+        
+        Returns:
+            Dict[str, Any]: The statistics, with the average response time in
+                seconds nested under "performance".
+        """
+        return {
+            "load_count": self.load_count,
+            "initialization_time": self.initialization_time,
+            "last_used": self.last_used,
+            "usage_count": self.usage_count,
+            "error_count": self.error_count,
+            "performance": {
+                "avg_response_time": self.avg_response_time_ns / 1e9,
+                "samples": self.samples
+            }
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "UsageStats":
+        """
+        Create statistics from their serialized dictionary form.
+        
+        Args:
+            data (Dict[str, Any]): The statistics as written by ``to_dict``.
+            
+        Returns:
+            UsageStats: The statistics.
+        """
+        performance = data.get("performance", {})
+        
+        # Some registries were saved with the average in nanoseconds
+        if "avg_response_time_ns" in performance:
+            avg_response_time_ns = round(performance["avg_response_time_ns"])
+        else:
+            avg_response_time_ns = round(performance.get("avg_response_time", 0) * 1e9)
+        
+        return cls(
+            load_count=data.get("load_count", 0),
+            initialization_time=data.get("initialization_time", 0),
+            last_used=data.get("last_used"),
+            usage_count=data.get("usage_count", 0),
+            error_count=data.get("error_count", 0),
+            avg_response_time_ns=avg_response_time_ns,
+            samples=performance.get("samples", 0)
+        )
+
+
+# Metadata keys stored as PluginMetadata fields rather than in ``extra``
+_METADATA_FIELDS = tuple(f.name for f in fields(PluginMetadata) if f.name != "extra")
+
 
 class PluginRegistryPlugin(BasePlugin):
     """
@@ -34,6 +337,12 @@ class PluginRegistryPlugin(BasePlugin):
     - Event hooks
     """
     
+    # Detection results keyed by plugin class. Detection only depends on the
+    # class, and a reloaded plugin module produces a new class object, so
+    # entries never need explicit invalidation.
+    _category_cache: Dict[type, str] = {}
+    _feature_cache: Dict[type, List[str]] = {}
+    
     @property
     def name(self) -> str:
         return "plugin_registry"
@@ -64,20 +373,62 @@ class PluginRegistryPlugin(BasePlugin):
         os.makedirs(self._registry_data_dir, exist_ok=True)
         
         # Plugin metadata (extended information beyond what the plugin manager provides)
-        self._plugin_metadata: Dict[str, Dict[str, Any]] = {}
+        self._plugin_metadata: Dict[str, PluginMetadata] = {}
         
         # Plugin usage statistics
-        self._usage_stats: Dict[str, Dict[str, Any]] = {}
+        self._usage_stats: Dict[str, UsageStats] = {}
         
-        # Integration points (key: integration_point, value: List of plugin names)
-        self._integration_points: Dict[str, List[str]] = {}
+        # Integration points (key: integration_point, value: Set of plugin names)
+        self._integration_points: Dict[str, Set[str]] = {}
         
         # Event hooks (key: event_name, value: Dict of plugin_name -> handler_info)
         self._event_hooks: Dict[str, Dict[str, Dict[str, Any]]] = {}
         
+        # Event handlers resolved for dispatch (key: event_name, value: List of
+        # (plugin_name, handler_name, handler, usage_stats) tuples). Rebuilt when
+        # the hooks or the plugin manager state change.
+        self._bound_hooks: Dict[str, List[Tuple[str, str, Callable[..., Any], Optional[UsageStats]]]] = {}
+        self._hooks_version = 0
+        self._bound_hooks_version: Tuple[int, int] = (-1, -1)
+        
+        # Frozen copies of the integration points and event hooks returned by
+        # the getters, rebuilt only after the underlying data has changed
+        self._integration_version = 0
+        self._integration_view: Mapping[str, FrozenSet[str]] = MappingProxyType({})
+        self._integration_view_version = -1
+        self._hooks_view: Mapping[str, Mapping[str, Mapping[str, Any]]] = MappingProxyType({})
+        self._hooks_view_version = -1
+        
+        # Whether registry data has been loaded from disk (see _ensure_loaded)
+        self._loaded = False
+        
+        # Sections modified since the last save (keys match the registry document)
+        self._dirty: Dict[str, bool] = {
+            "metadata": False,
+            "usage": False,
+            "integration": False,
+            "hooks": False
+        }
+        
+        # Incremented whenever plugin metadata changes; summaries derived from
+        # the metadata are cached against it
+        self._metadata_version = 0
+        self._categories_cache: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
+        self._categories_cache_version = -1
+        self._feature_index: Dict[str, Tuple[str, ...]] = {}
+        self._feature_index_version = -1
+        
+        # Number of plugins per health status, kept up to date as statuses change
+        self._health_counts: Counter = Counter()
+        
         # Last check time for plugin health
         self._last_health_check = 0
         self._health_check_interval = 300  # 5 minutes
+        
+        # Plugin manager version seen by the last health check, and the inputs
+        # each plugin's health status was last computed from
+        self._last_seen_plugin_version = -1
+        self._health_signatures: Dict[str, Tuple[bool, Tuple[str, ...], Tuple[bool, ...]]] = {}
     
     def initialize(self) -> bool:
         """
@@ -87,18 +438,10 @@ class PluginRegistryPlugin(BasePlugin):
             bool: True if initialization was successful, False otherwise.
         """
         try:
-            # Load metadata from disk if it exists
-            self._load_registry_data()
-            
-            # Initialize metadata for all currently loaded plugins
-            self._initialize_plugin_metadata()
-            
-            # Register for plugin events
+            # Register for plugin events; registry data itself is loaded on
+            # first use (see _ensure_loaded)
             self._register_for_plugin_events()
             
-            # Perform initial health check
-            self._check_plugin_health()
-            
             logger.info("Plugin registry initialized")
             self._enabled = True
             return True
@@ -126,31 +469,81 @@ class PluginRegistryPlugin(BasePlugin):
             logger.error(f"Failed to shut down plugin registry: {str(e)}")
             return False
     
+    def _ensure_loaded(self) -> None:
+        """
+        Load registry data and initialize plugin metadata on first use.
+        
+        Deferring this work keeps plugin registry initialization free of
+        disk I/O until the registry is actually queried or updated. If the
+        registry is never used, nothing is loaded and nothing is saved.
+        """
+        if self._loaded:
+            return
+        
+        self._loaded = True
+        
+        # Load metadata from disk if it exists
+        self._load_registry_data()
+        
+        # Initialize metadata for all currently loaded plugins
+        self._initialize_plugin_metadata()
+        
+        # Perform initial health check
+        self._check_plugin_health()
+    
     def _load_registry_data(self) -> None:
         """
         Load registry data from disk.
+        
+        Reads the combined registry document, falling back to the legacy
+        per-section files if the registry has not been saved in the new
+        format yet.
         """
-        metadata_file = os.path.join(self._registry_data_dir, "plugin_metadata.json")
-        usage_file = os.path.join(self._registry_data_dir, "usage_stats.json")
-        integration_file = os.path.join(self._registry_data_dir, "integration_points.json")
-        hooks_file = os.path.join(self._registry_data_dir, "event_hooks.json")
+        registry_file = os.path.join(self._registry_data_dir, REGISTRY_FILE)
         
         try:
-            if os.path.exists(metadata_file):
-                with open(metadata_file, "r") as f:
-                    self._plugin_metadata = json.load(f)
-            
-            if os.path.exists(usage_file):
-                with open(usage_file, "r") as f:
-                    self._usage_stats = json.load(f)
-            
-            if os.path.exists(integration_file):
-                with open(integration_file, "r") as f:
-                    self._integration_points = json.load(f)
+            if os.path.exists(registry_file):
+                with open(registry_file, "rb") as f:
+                    data = _load_json(f.read())
+            else:
+                data = {}
+                for section, filename in LEGACY_REGISTRY_FILES.items():
+                    legacy_file = os.path.join(self._registry_data_dir, filename)
+                    if os.path.exists(legacy_file):
+                        with open(legacy_file, "rb") as f:
+                            data[section] = _load_json(f.read())
+                
+                # Migrate legacy data into the combined registry on next save
+                self._mark_dirty(*data.keys())
             
-            if os.path.exists(hooks_file):
-                with open(hooks_file, "r") as f:
-                    self._event_hooks = json.load(f)
+            # Plugin names are interned so the keys of every section share
+            # one string object per plugin
+            if "metadata" in data:
+                self._plugin_metadata = {
+                    sys.intern(plugin_name): PluginMetadata.from_dict(metadata)
+                    for plugin_name, metadata in data["metadata"].items()
+                }
+                self._metadata_version += 1
+                self._health_counts = Counter(
+                    metadata.health_status for metadata in self._plugin_metadata.values()
+                )
+            if "usage" in data:
+                self._usage_stats = {
+                    sys.intern(plugin_name): UsageStats.from_dict(stats)
+                    for plugin_name, stats in data["usage"].items()
+                }
+            if "integration" in data:
+                self._integration_points = {
+                    integration_point: {sys.intern(plugin_name) for plugin_name in plugin_names}
+                    for integration_point, plugin_names in data["integration"].items()
+                }
+                self._integration_version += 1
+            if "hooks" in data:
+                self._event_hooks = {
+                    event_name: {sys.intern(plugin_name): hook_info for plugin_name, hook_info in hooks.items()}
+                    for event_name, hooks in data["hooks"].items()
+                }
+            self._hooks_version += 1
             
             logger.info("Loaded registry data from disk")
         
@@ -160,74 +553,98 @@ class PluginRegistryPlugin(BasePlugin):
     def _save_registry_data(self) -> None:
         """
         Save registry data to disk.
+        
+        All sections are written as a single document to a temporary file
+        which then atomically replaces the previous registry file. Nothing
+        is written if no section has changed since the last save.
         """
-        metadata_file = os.path.join(self._registry_data_dir, "plugin_metadata.json")
-        usage_file = os.path.join(self._registry_data_dir, "usage_stats.json")
-        integration_file = os.path.join(self._registry_data_dir, "integration_points.json")
-        hooks_file = os.path.join(self._registry_data_dir, "event_hooks.json")
+        if not any(self._dirty.values()):
+            logger.debug("Registry data unchanged, skipping save")
+            return
+        
+        registry_file = os.path.join(self._registry_data_dir, REGISTRY_FILE)
         
         try:
-            with open(metadata_file, "w") as f:
-                json.dump(self._plugin_metadata, f, indent=2)
-            
-            with open(usage_file, "w") as f:
-                json.dump(self._usage_stats, f, indent=2)
+            data = {
+                "metadata": {
+                    plugin_name: metadata.to_dict()
+                    for plugin_name, metadata in self._plugin_metadata.items()
+                },
+                "usage": {
+                    plugin_name: stats.to_dict()
+                    for plugin_name, stats in self._usage_stats.items()
+                },
+                "integration": {
+                    integration_point: sorted(plugin_names)
+                    for integration_point, plugin_names in self._integration_points.items()
+                },
+                "hooks": self._event_hooks
+            }
             
-            with open(integration_file, "w") as f:
-                json.dump(self._integration_points, f, indent=2)
+            _write_file_atomic(registry_file, _dump_json(data))
             
-            with open(hooks_file, "w") as f:
-                json.dump(self._event_hooks, f, indent=2)
+            for section in self._dirty:
+                self._dirty[section] = False
             
             logger.info("Saved registry data to disk")
         
         except Exception as e:
             logger.warning(f"Failed to save registry data: {str(e)}")
     
+    def _mark_dirty(self, *sections: str) -> None:
+        """
+        Mark registry sections as modified so they are written on the next save.
+        
+        Marking the metadata or integration section also invalidates the
+        cached data derived from it.
+        
+        Args:
+            *sections (str): The sections to mark ("metadata", "usage",
+                "integration" or "hooks").
+        """
+        for section in sections:
+            self._dirty[section] = True
+        
+        if "metadata" in sections:
+            self._metadata_version += 1
+        if "integration" in sections:
+            self._integration_version += 1
+    
     def _initialize_plugin_metadata(self) -> None:
         """
         Initialize metadata for all currently loaded plugins.
         """
+        now = datetime.now().isoformat()
+        
         for plugin_name, plugin in plugin_manager.get_all_plugins().items():
-            # Skip if we already have metadata for this plugin
-            if plugin_name in self._plugin_metadata:
+            # Skip self and plugins we already have metadata for
+            if plugin_name == self.name or plugin_name in self._plugin_metadata:
                 continue
             
+            plugin_name = sys.intern(plugin_name)
+            
             # Create basic metadata entry
-            self._plugin_metadata[plugin_name] = {
-                "name": plugin_name,
-                "version": plugin.version,
-                "description": plugin.description,
-                "author": plugin.author,
-                "dependencies": plugin.dependencies,
-                "first_registered": datetime.now().isoformat(),
-                "last_updated": datetime.now().isoformat(),
-                "category": self._detect_plugin_category(plugin),
-                "features": self._detect_plugin_features(plugin),
-                "health_status": "unknown",
-                "compatibility": {
-                    "min_app_version": "1.0.0",
-                    "max_app_version": None,
-                    "platform_compatibility": ["all"]
-                }
-            }
+            metadata = PluginMetadata(
+                name=plugin_name,
+                version=plugin.version,
+                description=plugin.description,
+                author=plugin.author,
+                dependencies=plugin.dependencies,
+                first_registered=now,
+                last_updated=now,
+                category=self._detect_plugin_category(plugin),
+                features=self._detect_plugin_features(plugin)
+            )
+            self._plugin_metadata[plugin_name] = metadata
+            self._health_counts[metadata.health_status] += 1
             
             # Initialize usage stats
             if plugin_name not in self._usage_stats:
-                self._usage_stats[plugin_name] = {
-                    "load_count": 0,
-                    "initialization_time": 0,
-                    "last_used": None,
-                    "usage_count": 0,
-                    "error_count": 0,
-                    "performance": {
-                        "avg_response_time": 0,
-                        "samples": 0
-                    }
-                }
+                self._usage_stats[plugin_name] = UsageStats()
             
             # Increment load count
-            self._usage_stats[plugin_name]["load_count"] += 1
+            self._usage_stats[plugin_name].load_count += 1
+            self._mark_dirty("metadata", "usage")
             
             # Auto-detect and register integration points
             self._detect_integration_points(plugin_name, plugin)
@@ -244,25 +661,23 @@ class PluginRegistryPlugin(BasePlugin):
         Returns:
             str: The detected category.
         """
+        plugin_class = type(plugin)
+        if plugin_class in self._category_cache:
+            return self._category_cache[plugin_class]
+        
         name = plugin.name.lower()
         description = plugin.description.lower()
         
-        if "dashboard" in name or "dashboard" in description or "ui" in name:
-            return "ui"
-        elif "log" in name or "logging" in description:
-            return "logging"
-        elif "notification" in name or "notification" in description or "alert" in name:
-            return "notification"
-        elif "integration" in name or "connect" in description:
-            return "integration"
-        elif "security" in name or "auth" in name:
-            return "security"
-        elif "data" in name or "database" in description or "storage" in name:
-            return "data"
-        elif "utility" in name or "util" in name:
-            return "utility"
-        else:
-            return "other"
+        category = "other"
+        for candidate, name_pattern, description_pattern in CATEGORY_PATTERNS:
+            if (name_pattern and name_pattern.search(name)) or (
+                description_pattern and description_pattern.search(description)
+            ):
+                category = candidate
+                break
+        
+        self._category_cache[plugin_class] = category
+        return category
     
     def _detect_plugin_features(self, plugin: Any) -> List[str]:
         """
@@ -274,38 +689,21 @@ class PluginRegistryPlugin(BasePlugin):
         Returns:
             List[str]: The detected features.
         """
-        features = []
+        plugin_class = type(plugin)
+        if plugin_class in self._feature_cache:
+            return list(self._feature_cache[plugin_class])
         
-        # Check for common method patterns
-        for attr_name in dir(plugin):
-            if attr_name.startswith("_"):
-                continue
-                
-            attr = getattr(plugin, attr_name)
-            attr_name_lower = attr_name.lower()
-            
-            if callable(attr):
-                # UI-related methods
-                if "render" in attr_name_lower or "display" in attr_name_lower or "view" in attr_name_lower:
-                    features.append("ui")
-                
-                # Data processing methods
-                if "process" in attr_name_lower or "transform" in attr_name_lower or "convert" in attr_name_lower:
-                    features.append("data_processing")
-                
-                # Export/import methods
-                if "export" in attr_name_lower or "import" in attr_name_lower:
-                    features.append("data_exchange")
-                
-                # API-related methods
-                if "api" in attr_name_lower or "endpoint" in attr_name_lower or "route" in attr_name_lower:
-                    features.append("api")
-                
-                # Authentication methods
-                if "auth" in attr_name_lower or "login" in attr_name_lower or "permission" in attr_name_lower:
-                    features.append("authentication")
+        detected: Set[str] = set()
         
-        return list(set(features))  # Remove duplicates
+        # Check for common method patterns
+        for attr_name, attr in _iter_public_attributes(plugin):
+            matches = FEATURE_PATTERN.findall(attr_name)
+            if matches and _is_method(attr):
+                detected.update(FEATURE_TAGS[match.lower()] for match in matches)
+        
+        features = list(detected)
+        self._feature_cache[plugin_class] = features
+        return list(features)
     
     def _detect_integration_points(self, plugin_name: str, plugin: Any) -> None:
         """
@@ -316,19 +714,22 @@ class PluginRegistryPlugin(BasePlugin):
             plugin: The plugin instance.
         """
         # Look for integration methods
-        for attr_name in dir(plugin):
-            if attr_name.startswith("_") or not callable(getattr(plugin, attr_name)):
-                continue
-            
+        for attr_name, attr in _iter_public_attributes(plugin):
             attr_name_lower = attr_name.lower()
             
+            # Check the cheap name patterns before inspecting the attribute
+            is_integration = "integrate_with" in attr_name_lower or "register_with" in attr_name_lower
+            is_hook = "on_" in attr_name_lower
+            if not (is_integration or is_hook) or not _is_method(attr):
+                continue
+            
             # Handle integration methods named after common patterns
-            if "integrate_with" in attr_name_lower or "register_with" in attr_name_lower:
+            if is_integration:
                 integration_point = attr_name_lower.replace("integrate_with_", "").replace("register_with_", "")
                 self.register_integration_point(plugin_name, integration_point)
             
             # Handle hook methods
-            if "on_" in attr_name_lower:
+            if is_hook:
                 event_name = attr_name_lower.replace("on_", "")
                 self.register_event_hook(plugin_name, event_name, attr_name)
     
@@ -345,6 +746,10 @@ class PluginRegistryPlugin(BasePlugin):
     def _check_plugin_health(self) -> None:
         """
         Check the health status of all plugins.
+        
+        The scan is skipped entirely if no plugin has been loaded, unloaded,
+        enabled or disabled since the last check, and plugins whose enabled
+        state and dependencies are unchanged keep their previous status.
         """
         current_time = time.time()
         
@@ -354,50 +759,108 @@ class PluginRegistryPlugin(BasePlugin):
         
         self._last_health_check = current_time
         
-        for plugin_name, plugin in plugin_manager.get_all_plugins().items():
+        # Nothing to do if the plugin state has not changed
+        plugin_version = plugin_manager.version
+        if plugin_version == self._last_seen_plugin_version:
+            return
+        
+        self._last_seen_plugin_version = plugin_version
+        now = datetime.now().isoformat()
+        
+        # Snapshot of enabled plugins, shared by all dependency checks below
+        plugins = plugin_manager.get_all_plugins()
+        enabled = {name for name, plugin in plugins.items() if plugin.enabled}
+        
+        for plugin_name, plugin in plugins.items():
             # Skip self
             if plugin_name == self.name:
                 continue
             
+            # Plugin-defined properties are the only foreign code run here
             try:
-                # Check if plugin is enabled
-                is_enabled = plugin_manager.is_plugin_enabled(plugin_name)
-                
-                # Check dependencies
-                dependencies_ok = True
-                for dependency in plugin.dependencies:
-                    if not plugin_manager.get_plugin(dependency) or not plugin_manager.is_plugin_enabled(dependency):
-                        dependencies_ok = False
-                        break
-                
-                # Determine health status
-                if is_enabled and dependencies_ok:
-                    health_status = "healthy"
-                elif is_enabled and not dependencies_ok:
-                    health_status = "degraded"
-                else:
-                    health_status = "disabled"
-                
-                # Update metadata
-                if plugin_name in self._plugin_metadata:
-                    self._plugin_metadata[plugin_name]["health_status"] = health_status
-                    self._plugin_metadata[plugin_name]["last_health_check"] = datetime.now().isoformat()
-            
+                dependencies = tuple(plugin.dependencies)
             except Exception as e:
-                logger.warning(f"Failed to check health for plugin {plugin_name}: {str(e)}")
-                
-                # Update metadata to indicate error
-                if plugin_name in self._plugin_metadata:
-                    self._plugin_metadata[plugin_name]["health_status"] = "error"
-                    self._plugin_metadata[plugin_name]["last_health_check"] = datetime.now().isoformat()
-                    self._plugin_metadata[plugin_name]["last_error"] = str(e)
-                
-                # Update usage stats
-                if plugin_name in self._usage_stats:
-                    self._usage_stats[plugin_name]["error_count"] += 1
+                self._record_health_error(plugin_name, e, now)
+                continue
+            
+            # Check if plugin and its dependencies are enabled
+            is_enabled = plugin_name in enabled
+            dependency_states = tuple(dependency in enabled for dependency in dependencies)
+            
+            # Skip plugins whose health inputs are unchanged
+            signature = (is_enabled, dependencies, dependency_states)
+            if self._health_signatures.get(plugin_name) == signature:
+                continue
+            
+            self._health_signatures[plugin_name] = signature
+            
+            # Update metadata
+            if plugin_name in self._plugin_metadata:
+                metadata = self._plugin_metadata[plugin_name]
+                self._set_health_status(
+                    metadata, self._compute_health_status(is_enabled, all(dependency_states))
+                )
+                metadata.last_health_check = now
+                self._mark_dirty("metadata")
         
         logger.info("Completed plugin health check")
     
+    def _set_health_status(self, metadata: PluginMetadata, status: str) -> None:
+        """
+        Set a plugin's health status and update the per-status counts.
+        
+        Args:
+            metadata (PluginMetadata): The plugin's metadata.
+            status (str): The new health status.
+        """
+        self._health_counts[metadata.health_status] -= 1
+        self._health_counts[status] += 1
+        metadata.health_status = status
+    
+    @staticmethod
+    def _compute_health_status(is_enabled: bool, dependencies_ok: bool) -> str:
+        """
+        Determine a plugin's health status.
+        
+        Args:
+            is_enabled (bool): Whether the plugin is enabled.
+            dependencies_ok (bool): Whether all of the plugin's dependencies are enabled.
+            
+        Returns:
+            str: The health status ("healthy", "degraded" or "disabled").
+        """
+        if is_enabled and dependencies_ok:
+            return "healthy"
+        elif is_enabled:
+            return "degraded"
+        else:
+            return "disabled"
+    
+    def _record_health_error(self, plugin_name: str, error: Exception, timestamp: str) -> None:
+        """
+        Record a failed health check for a plugin.
+        
+        Args:
+            plugin_name (str): The name of the plugin.
+            error (Exception): The error raised while checking the plugin.
+            timestamp (str): ISO timestamp of the health check.
+        """
+        logger.warning(f"Failed to check health for plugin {plugin_name}: {str(error)}")
+        self._health_signatures.pop(plugin_name, None)
+        
+        # Update metadata to indicate error
+        if plugin_name in self._plugin_metadata:
+            metadata = self._plugin_metadata[plugin_name]
+            self._set_health_status(metadata, "error")
+            metadata.last_health_check = timestamp
+            metadata.last_error = str(error)
+            self._mark_dirty("metadata")
+        
+        # Update usage stats
+        if plugin_name in self._usage_stats:
+            self._usage_stats[plugin_name].error_count += 1
+            self._mark_dirty("usage")
+    
     #
     # Public API
     #
@@ -410,18 +873,23 @@ class PluginRegistryPlugin(BasePlugin):
             plugin_name (str): The name of the plugin.
             
         Returns:
-            Optional[Dict[str, Any]]: The plugin metadata, or None if not found.
+            Optional[Dict[str, Any]]: A copy of the plugin metadata, or None if not found.
         """
-        return self._plugin_metadata.get(plugin_name)
+        self._ensure_loaded()
+        
+        metadata = self._plugin_metadata.get(plugin_name)
+        return metadata.to_dict() if metadata is not None else None
     
     def get_all_plugin_metadata(self) -> Dict[str, Dict[str, Any]]:
         """
         Get extended metadata for all plugins.
         
         Returns:
-            Dict[str, Dict[str, Any]]: Dictionary of plugin names to metadata.
+            Dict[str, Dict[str, Any]]: Dictionary of plugin names to copies of their metadata.
         """
-        return self._plugin_metadata.copy()
+        self._ensure_loaded()
+        
+        return {plugin_name: metadata.to_dict() for plugin_name, metadata in self._plugin_metadata.items()}
     
     def update_plugin_metadata(self, plugin_name: str, metadata: Dict[str, Any]) -> bool:
         """
@@ -434,41 +902,58 @@ class PluginRegistryPlugin(BasePlugin):
         Returns:
             bool: True if the metadata was updated, False otherwise.
         """
+        self._ensure_loaded()
+        
         if plugin_name not in self._plugin_metadata:
             logger.warning(f"Plugin {plugin_name} not found in registry")
             return False
         
         # Update the metadata
-        self._plugin_metadata[plugin_name].update(metadata)
+        entry = self._plugin_metadata[plugin_name]
+        previous_status = entry.health_status
+        entry.update(metadata)
+        if entry.health_status != previous_status:
+            self._health_counts[previous_status] -= 1
+            self._health_counts[entry.health_status] += 1
         
         # Update the last_updated timestamp
-        self._plugin_metadata[plugin_name]["last_updated"] = datetime.now().isoformat()
+        entry.last_updated = datetime.now().isoformat()
+        self._mark_dirty("metadata")
         
         logger.info(f"Updated metadata for plugin: {plugin_name}")
         return True
     
-    def record_plugin_usage(self, plugin_name: str, operation: str = "usage") -> bool:
+    def record_plugin_usage(
+        self, plugin_name: str, operation: str = "usage", timestamp: Optional[str] = None
+    ) -> bool:
         """
         Record usage of a plugin.
         
         Args:
             plugin_name (str): The name of the plugin.
             operation (str): The operation being performed (usage, error, etc).
+            timestamp (Optional[str]): ISO timestamp of the usage. Defaults to now;
+                callers recording many usages at once can pass a shared value.
             
         Returns:
             bool: True if the usage was recorded, False otherwise.
         """
+        self._ensure_loaded()
+        
+        plugin_name = sys.intern(plugin_name)
         if plugin_name not in self._usage_stats:
             logger.warning(f"Plugin {plugin_name} not found in usage stats")
             return False
         
         # Update usage stats based on operation
+        stats = self._usage_stats[plugin_name]
         if operation == "usage":
-            self._usage_stats[plugin_name]["usage_count"] += 1
-            self._usage_stats[plugin_name]["last_used"] = datetime.now().isoformat()
+            stats.usage_count += 1
+            stats.last_used = timestamp or datetime.now().isoformat()
         elif operation == "error":
-            self._usage_stats[plugin_name]["error_count"] += 1
+            stats.error_count += 1
         
+        self._mark_dirty("usage")
         logger.debug(f"Recorded {operation} for plugin: {plugin_name}")
         return True
     
@@ -476,22 +961,29 @@ class PluginRegistryPlugin(BasePlugin):
         """
         Get usage statistics for a plugin.
         
+        Response times are reported in seconds (``performance.avg_response_time``).
+        
         Args:
             plugin_name (str): The name of the plugin.
             
         Returns:
-            Optional[Dict[str, Any]]: The usage statistics, or None if not found.
+            Optional[Dict[str, Any]]: A copy of the usage statistics, or None if not found.
         """
-        return self._usage_stats.get(plugin_name)
+        self._ensure_loaded()
+        
+        stats = self._usage_stats.get(plugin_name)
+        return stats.to_dict() if stats is not None else None
     
     def get_all_usage_stats(self) -> Dict[str, Dict[str, Any]]:
         """
         Get usage statistics for all plugins.
         
         Returns:
-            Dict[str, Dict[str, Any]]: Dictionary of plugin names to usage statistics.
+            Dict[str, Dict[str, Any]]: Dictionary of plugin names to copies of their usage statistics.
         """
-        return self._usage_stats.copy()
+        self._ensure_loaded()
+        
+        return {plugin_name: stats.to_dict() for plugin_name, stats in self._usage_stats.items()}
     
     def register_integration_point(self, plugin_name: str, integration_point: str) -> bool:
         """
@@ -504,18 +996,20 @@ class PluginRegistryPlugin(BasePlugin):
         Returns:
             bool: True if the plugin was registered, False otherwise.
         """
+        self._ensure_loaded()
+        
+        plugin_name = sys.intern(plugin_name)
+        
         # Ensure plugin exists
         if not plugin_manager.get_plugin(plugin_name):
             logger.warning(f"Cannot register integration point: Plugin {plugin_name} not found")
             return False
         
-        # Create integration point if it doesn't exist
-        if integration_point not in self._integration_points:
-            self._integration_points[integration_point] = []
-        
         # Add plugin to integration point if not already registered
-        if plugin_name not in self._integration_points[integration_point]:
-            self._integration_points[integration_point].append(plugin_name)
+        plugin_names = self._integration_points.setdefault(integration_point, set())
+        if plugin_name not in plugin_names:
+            plugin_names.add(plugin_name)
+            self._mark_dirty("integration")
             logger.info(f"Registered plugin {plugin_name} for integration point: {integration_point}")
         
         return True
@@ -531,6 +1025,8 @@ class PluginRegistryPlugin(BasePlugin):
         Returns:
             bool: True if the plugin was unregistered, False otherwise.
         """
+        self._ensure_loaded()
+        
         # Check if integration point exists
         if integration_point not in self._integration_points:
             logger.warning(f"Integration point {integration_point} not found")
@@ -539,13 +1035,14 @@ class PluginRegistryPlugin(BasePlugin):
         # Remove plugin from integration point
         if plugin_name in self._integration_points[integration_point]:
             self._integration_points[integration_point].remove(plugin_name)
+            self._mark_dirty("integration")
             logger.info(f"Unregistered plugin {plugin_name} from integration point: {integration_point}")
             return True
         
         logger.warning(f"Plugin {plugin_name} not registered for integration point: {integration_point}")
         return False
     
-    def get_plugins_for_integration_point(self, integration_point: str) -> List[str]:
+    def get_plugins_for_integration_point(self, integration_point: str) -> Tuple[str, ...]:
         """
         Get all plugins registered for an integration point.
         
@@ -553,18 +1050,32 @@ class PluginRegistryPlugin(BasePlugin):
             integration_point (str): The integration point to get plugins for.
             
         Returns:
-            List[str]: List of plugin names registered for the integration point.
+            Tuple[str, ...]: Plugin names registered for the integration point. This
+                is a tuple rather than a list, so it cannot be used to modify the registry.
         """
-        return self._integration_points.get(integration_point, []).copy()
+        self._ensure_loaded()
+        
+        return tuple(self._integration_points.get(integration_point, ()))
     
-    def get_all_integration_points(self) -> Dict[str, List[str]]:
+    def get_all_integration_points(self) -> Mapping[str, FrozenSet[str]]:
         """
         Get all integration points and their registered plugins.
         
         Returns:
-            Dict[str, List[str]]: Dictionary of integration points to lists of plugin names.
+            Mapping[str, FrozenSet[str]]: Read-only mapping of integration points to
+                frozen sets of plugin names. The mapping is a snapshot, cached until
+                an integration point is registered or unregistered.
         """
-        return self._integration_points.copy()
+        self._ensure_loaded()
+        
+        if self._integration_view_version != self._integration_version:
+            self._integration_view = MappingProxyType({
+                integration_point: frozenset(plugin_names)
+                for integration_point, plugin_names in self._integration_points.items()
+            })
+            self._integration_view_version = self._integration_version
+        
+        return self._integration_view
     
     def register_event_hook(self, plugin_name: str, event_name: str, handler_name: str) -> bool:
         """
@@ -578,6 +1089,10 @@ class PluginRegistryPlugin(BasePlugin):
         Returns:
             bool: True if the hook was registered, False otherwise.
         """
+        self._ensure_loaded()
+        
+        plugin_name = sys.intern(plugin_name)
+        
         # Ensure plugin exists
         plugin = plugin_manager.get_plugin(plugin_name)
         if not plugin:
@@ -585,7 +1100,7 @@ class PluginRegistryPlugin(BasePlugin):
             return False
         
         # Ensure handler method exists
-        if not hasattr(plugin, handler_name) or not callable(getattr(plugin, handler_name)):
+        if not callable(getattr(plugin, handler_name, None)):
             logger.warning(f"Cannot register event hook: Handler method {handler_name} not found in plugin {plugin_name}")
             return False
         
@@ -598,6 +1113,8 @@ class PluginRegistryPlugin(BasePlugin):
             "handler_name": handler_name,
             "registered_at": datetime.now().isoformat()
         }
+        self._hooks_version += 1
+        self._mark_dirty("hooks")
         
         logger.info(f"Registered event hook: {plugin_name}.{handler_name} for event {event_name}")
         return True
@@ -613,6 +1130,8 @@ class PluginRegistryPlugin(BasePlugin):
         Returns:
             bool: True if the hook was unregistered, False otherwise.
         """
+        self._ensure_loaded()
+        
         # Check if event exists
         if event_name not in self._event_hooks:
             logger.warning(f"Event {event_name} not found")
@@ -621,32 +1140,43 @@ class PluginRegistryPlugin(BasePlugin):
         # Remove handler from event
         if plugin_name in self._event_hooks[event_name]:
             del self._event_hooks[event_name][plugin_name]
+            self._hooks_version += 1
+            self._mark_dirty("hooks")
             logger.info(f"Unregistered event hook: {plugin_name} for event {event_name}")
             return True
         
         logger.warning(f"Plugin {plugin_name} not registered for event: {event_name}")
         return False
     
-    def trigger_event(self, event_name: str, **event_data) -> Dict[str, Any]:
+    def _get_bound_hooks(
+        self, event_name: str
+    ) -> List[Tuple[str, str, Callable[..., Any], Optional[UsageStats]]]:
         """
-        Trigger an event and call all registered handlers.
+        Get the resolved handlers for an event.
+        
+        Handlers are resolved once and cached until an event hook is
+        registered or unregistered, or the plugin manager reports that a
+        plugin was loaded, unloaded, enabled or disabled.
         
         Args:
-            event_name (str): The name of the event to trigger.
-            **event_data: Event data to pass to handlers.
+            event_name (str): The name of the event.
             
         Returns:
-            Dict[str, Any]: Dictionary of plugin names to handler results.
+            List[Tuple[str, str, Callable[..., Any], Optional[UsageStats]]]:
+                (plugin_name, handler_name, handler, usage_stats) for every
+                enabled plugin with a valid handler.
         """
-        results = {}
+        version = (self._hooks_version, plugin_manager.version)
+        if version != self._bound_hooks_version:
+            self._bound_hooks.clear()
+            self._bound_hooks_version = version
         
-        # Check if event exists
-        if event_name not in self._event_hooks:
-            logger.warning(f"No handlers registered for event: {event_name}")
-            return results
+        bound = self._bound_hooks.get(event_name)
+        if bound is not None:
+            return bound
         
-        # Call each handler
-        for plugin_name, hook_info in self._event_hooks[event_name].items():
+        bound = []
+        for plugin_name, hook_info in self._event_hooks.get(event_name, {}).items():
             handler_name = hook_info["handler_name"]
             
             # Get plugin
@@ -656,62 +1186,89 @@ class PluginRegistryPlugin(BasePlugin):
                 continue
             
             # Check if plugin is enabled
-            if not plugin_manager.is_plugin_enabled(plugin_name):
+            if not plugin.enabled:
                 logger.warning(f"Plugin {plugin_name} is disabled, skipping event handler")
                 continue
             
             # Get handler method
-            if not hasattr(plugin, handler_name) or not callable(getattr(plugin, handler_name)):
+            handler = getattr(plugin, handler_name, None)
+            if not callable(handler):
                 logger.warning(f"Handler method {handler_name} not found in plugin {plugin_name}")
                 continue
             
-            handler = getattr(plugin, handler_name)
+            bound.append((plugin_name, handler_name, handler, self._usage_stats.get(plugin_name)))
+        
+        self._bound_hooks[event_name] = bound
+        return bound
+    
+    def trigger_event(self, event_name: str, **event_data) -> Dict[str, Any]:
+        """
+        Trigger an event and call all registered handlers.
+        
+        Args:
+            event_name (str): The name of the event to trigger.
+            **event_data: Event data to pass to handlers.
             
-            # Call handler
+        Returns:
+            Dict[str, Any]: Dictionary of plugin names to handler results.
+        """
+        self._ensure_loaded()
+        
+        results = {}
+        
+        # Check if event exists
+        if event_name not in self._event_hooks:
+            logger.warning(f"No handlers registered for event: {event_name}")
+            return results
+        
+        # Shared timestamp for every usage recorded by this event
+        now = datetime.now().isoformat()
+        
+        # Call each handler
+        for plugin_name, handler_name, handler, usage in self._get_bound_hooks(event_name):
             try:
                 # Record start time for performance measurement
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 
                 # Call the handler with event data
                 result = handler(**event_data)
                 
                 # Calculate elapsed time
-                elapsed_time = time.time() - start_time
+                elapsed_ns = time.perf_counter_ns() - start_ns
                 
-                # Update performance stats
-                if plugin_name in self._usage_stats:
-                    stats = self._usage_stats[plugin_name]["performance"]
-                    avg_time = stats["avg_response_time"]
-                    samples = stats["samples"]
+                # Update performance stats and record usage
+                if usage is not None:
+                    samples = usage.samples
                     
-                    # Update average using weighted average formula
-                    if samples > 0:
-                        stats["avg_response_time"] = (avg_time * samples + elapsed_time) / (samples + 1)
-                    else:
-                        stats["avg_response_time"] = elapsed_time
+                    # Update the running mean incrementally; this also covers the first sample.
+                    # Rounding keeps it in integer nanoseconds without the downward
+                    # bias floor division would accumulate
+                    usage.avg_response_time_ns += round((elapsed_ns - usage.avg_response_time_ns) / (samples + 1))
+                    usage.samples = samples + 1
                     
-                    stats["samples"] += 1
-                
-                # Record usage
-                self.record_plugin_usage(plugin_name)
+                    usage.usage_count += 1
+                    usage.last_used = now
+                    self._mark_dirty("usage")
                 
                 # Store result
                 results[plugin_name] = result
                 
-                logger.debug(f"Triggered event {event_name} handler in {plugin_name}: {handler_name} (took {elapsed_time:.6f}s)")
+                logger.debug(f"Triggered event {event_name} handler in {plugin_name}: {handler_name} (took {elapsed_ns / 1e9:.6f}s)")
             
             except Exception as e:
                 logger.error(f"Error in event handler {plugin_name}.{handler_name}: {str(e)}")
                 
                 # Record error
-                self.record_plugin_usage(plugin_name, "error")
+                if usage is not None:
+                    usage.error_count += 1
+                    self._mark_dirty("usage")
                 
                 # Store error result
                 results[plugin_name] = {"error": str(e)}
         
         return results
     
-    def get_event_hooks(self, event_name: str) -> Dict[str, Dict[str, Any]]:
+    def get_event_hooks(self, event_name: str) -> Mapping[str, Mapping[str, Any]]:
         """
         Get all plugins registered for an event.
         
@@ -719,18 +1276,33 @@ class PluginRegistryPlugin(BasePlugin):
             event_name (str): The name of the event to get hooks for.
             
         Returns:
-            Dict[str, Dict[str, Any]]: Dictionary of plugin names to hook information.
+            Mapping[str, Mapping[str, Any]]: Read-only mapping of plugin names to hook
+                information (see get_all_event_hooks).
         """
-        return self._event_hooks.get(event_name, {}).copy()
+        return self.get_all_event_hooks().get(event_name, MappingProxyType({}))
     
-    def get_all_event_hooks(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    def get_all_event_hooks(self) -> Mapping[str, Mapping[str, Mapping[str, Any]]]:
         """
         Get all events and their registered hooks.
         
         Returns:
-            Dict[str, Dict[str, Dict[str, Any]]]: Dictionary of events to dictionaries of plugin names to hook information.
+            Mapping[str, Mapping[str, Mapping[str, Any]]]: Read-only mapping of events to
+                plugin names to hook information. The mapping is a snapshot, cached
+                until an event hook is registered or unregistered.
         """
-        return self._event_hooks.copy()
+        self._ensure_loaded()
+        
+        if self._hooks_view_version != self._hooks_version:
+            self._hooks_view = MappingProxyType({
+                event_name: MappingProxyType({
+                    plugin_name: MappingProxyType(dict(hook_info))
+                    for plugin_name, hook_info in hooks.items()
+                })
+                for event_name, hooks in self._event_hooks.items()
+            })
+            self._hooks_view_version = self._hooks_version
+        
+        return self._hooks_view
     
     def get_dependency_graph(self) -> Dict[str, List[str]]:
         """
@@ -739,10 +1311,22 @@ class PluginRegistryPlugin(BasePlugin):
         Returns:
             Dict[str, List[str]]: Dictionary of plugin names to lists of dependent plugin names.
         """
-        graph = {}
+        return self._build_dependency_graph(plugin_manager.get_all_plugins())
+    
+    def _build_dependency_graph(self, plugins: Dict[str, Any]) -> Dict[str, List[str]]:
+        """
+        Build the dependency graph for a set of plugins.
+        
+        Args:
+            plugins (Dict[str, Any]): Dictionary of plugin names to plugin instances.
+            
+        Returns:
+            Dict[str, List[str]]: Dictionary of plugin names to lists of dependent plugin names.
+        """
+        graph: Dict[str, List[str]] = {}
         
         # Build the dependency graph
-        for plugin_name, plugin in plugin_manager.get_all_plugins().items():
+        for plugin_name, plugin in plugins.items():
             # Add the plugin to the graph if not already there
             if plugin_name not in graph:
                 graph[plugin_name] = []
@@ -766,42 +1350,51 @@ class PluginRegistryPlugin(BasePlugin):
             Dict[str, Dict[str, Any]]: Dictionary of plugin names to compatibility information.
         """
         compatibility = {}
+        plugins = plugin_manager.get_all_plugins()
         
         # Analyze dependency graph for conflicts and unmet dependencies
-        dependency_graph = self.get_dependency_graph()
+        dependency_graph = self._build_dependency_graph(plugins)
         
-        for plugin_name, plugin in plugin_manager.get_all_plugins().items():
+        for plugin_name, plugin in plugins.items():
             compatibility[plugin_name] = {
-                "missing_dependencies": [],
+                # Dependencies that are not among the loaded plugins
+                "missing_dependencies": [
+                    dependency for dependency in plugin.dependencies if dependency not in plugins
+                ],
                 "dependent_plugins": dependency_graph.get(plugin_name, []),
                 "conflicts": []
             }
-            
-            # Check for missing dependencies
-            for dependency in plugin.dependencies:
-                if not plugin_manager.get_plugin(dependency):
-                    compatibility[plugin_name]["missing_dependencies"].append(dependency)
         
         return compatibility
     
-    def get_plugin_categories(self) -> Dict[str, List[str]]:
+    def get_plugin_categories(self) -> Mapping[str, Tuple[str, ...]]:
         """
         Get plugins grouped by category.
         
         Returns:
-            Dict[str, List[str]]: Dictionary of categories to lists of plugin names.
+            Mapping[str, Tuple[str, ...]]: Read-only mapping of categories to plugin names.
+                The mapping is cached until plugin metadata changes.
         """
-        categories = {}
+        self._ensure_loaded()
+        
+        if self._categories_cache_version == self._metadata_version:
+            return self._categories_cache
+        
+        categories: Dict[str, List[str]] = {}
         
         for plugin_name, metadata in self._plugin_metadata.items():
-            category = metadata.get("category", "other")
+            category = metadata.category
             
             if category not in categories:
                 categories[category] = []
             
             categories[category].append(plugin_name)
         
-        return categories
+        self._categories_cache = MappingProxyType({
+            category: tuple(plugin_names) for category, plugin_names in categories.items()
+        })
+        self._categories_cache_version = self._metadata_version
+        return self._categories_cache
     
     def get_plugins_by_feature(self, feature: str) -> List[str]:
         """
@@ -813,13 +1406,35 @@ class PluginRegistryPlugin(BasePlugin):
         Returns:
             List[str]: List of plugin names with the specified feature.
         """
-        result = []
+        self._ensure_loaded()
+        
+        return list(self._get_feature_index().get(feature, ()))
+    
+    def _get_feature_index(self) -> Dict[str, Tuple[str, ...]]:
+        """
+        Get the index of features to the plugins that have them.
+        
+        The index is rebuilt only when plugin metadata has changed since it
+        was last built.
+        
+        Returns:
+            Dict[str, Tuple[str, ...]]: Dictionary of features to plugin names.
+        """
+        if self._feature_index_version == self._metadata_version:
+            return self._feature_index
+        
+        index: Dict[str, List[str]] = {}
         
         for plugin_name, metadata in self._plugin_metadata.items():
-            if feature in metadata.get("features", []):
-                result.append(plugin_name)
+            for feature in set(metadata.features):
+                if feature not in index:
+                    index[feature] = []
+                
+                index[feature].append(plugin_name)
         
-        return result
+        self._feature_index = {feature: tuple(plugin_names) for feature, plugin_names in index.items()}
+        self._feature_index_version = self._metadata_version
+        return self._feature_index
     
     def get_health_summary(self) -> Dict[str, int]:
         """
@@ -828,17 +1443,6 @@ class PluginRegistryPlugin(BasePlugin):
         Returns:
             Dict[str, int]: Dictionary of health status to count of plugins with that status.
         """
-        summary = {
-            "healthy": 0,
-            "degraded": 0,
-            "disabled": 0,
-            "error": 0,
-            "unknown": 0
-        }
-        
-        for metadata in self._plugin_metadata.values():
-            status = metadata.get("health_status", "unknown")
-            if status in summary:
-                summary[status] += 1
+        self._ensure_loaded()
         
-        return summary 
\ No newline at end of file
+        return {status: self._health_counts[status] for status in HEALTH_STATUSES} 
\ No newline at end of file
@@ -1,17 +1,210 @@
 """
 A logging plugin that enhances the application's logging capabilities.
 """
+import bisect
 import logging
+import logging.handlers
 import json
 import os
+import threading
 import time
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+import traceback
+from collections import deque
+from operator import attrgetter
+from datetime import date, datetime
+from typing import Deque, Dict, Any, Iterator, List, Optional
 
 from myproject.plugins.core.base import BasePlugin
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Log level names accepted in the plugin configuration
+LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL
+}
+
+# Log filename for the current day, keyed by the date's ordinal
+_log_filename_cache: Dict[int, str] = {}
+
+
+def _to_microseconds(created: float) -> int:
+    """
+    Convert a POSIX timestamp to whole microseconds.
+    
+    Rounds the same way as datetime.fromtimestamp, so a record's time matches
+    the microseconds shown in its ISO timestamp.
+    
+    Args:
+        created (float): The POSIX timestamp.
+        
+    Returns:
+        int: Microseconds since the epoch.
+    """
+    seconds = int(created)
+    return seconds * 1_000_000 + round((created - seconds) * 1e6)
+
+
+def _count_time_inversions(times: Deque[int]) -> int:
+    """
+    Count the places where a time is earlier than the one before it.
+    
+    Args:
+        times (Deque[int]): The times, in buffer order.
+        
+    Returns:
+        int: The number of out-of-order neighbours.
+    """
+    previous = list(times)
+    return sum(1 for earlier, later in zip(previous, previous[1:]) if later < earlier)
+
+
+def _iso_to_microseconds(value: str) -> int:
+    """
+    Convert an ISO timestamp to whole microseconds since the epoch.
+    
+    Args:
+        value (str): The ISO timestamp; naive timestamps are taken as local time.
+        
+    Returns:
+        int: Microseconds since the epoch.
+    """
+    dt = datetime.fromisoformat(value)
+    return int(dt.replace(microsecond=0).timestamp()) * 1_000_000 + dt.microsecond
+
+
+class LogEntry:
+    """
+    A log record captured in the in-memory buffer.
+    
+    The message is formatted from the record's msg and args the first time it
+    is read, so entries that are never queried or exported skip the work. The
+    same goes for the traceback of records logged with exception info, and
+    for the ISO timestamp.
+    """
+    
+    __slots__ = (
+        "created", "level", "logger", "module", "function", "line",
+        "_timestamp", "_msg", "_args", "_message", "_exception", "_traceback"
+    )
+    
+    def __init__(self, record: logging.LogRecord):
+        """
+        Capture a log record.
+        
+        Args:
+            record (logging.LogRecord): The log record to capture.
+        """
+        self.created = record.created
+        self._timestamp: Optional[str] = None
+        self.level = record.levelname
+        self.logger = record.name
+        self.module = record.module
+        self.function = record.funcName
+        self.line = record.lineno
+        self._msg = record.msg
+        self._args = record.args
+        self._message: Optional[str] = None
+        self._exception: Optional[str] = None
+        
+        # Capture the traceback without keeping its frames alive; source
+        # lines are looked up when it is formatted
+        self._traceback: Optional[traceback.TracebackException] = None
+        if record.exc_info and record.exc_info[0] is not None:
+            self._traceback = traceback.TracebackException(*record.exc_info, lookup_lines=False)
+    
+    @property
+    def timestamp(self) -> str:
+        """
+        Get the ISO timestamp of the record, in local time.
+        
+        Returns:
+            str: The timestamp.
+        """
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self.created).isoformat()
+        return self._timestamp
+    
+    @property
+    def message(self) -> str:
+        """
+        Get the formatted log message.
+        
+        Returns:
+            str: The message with its arguments merged in.
+        """
+        # Entries are read by several threads at once, so the message is
+        # built from the record's msg and args without clearing them
+        message = self._message
+        if message is None:
+            message = str(self._msg)
+            args = self._args
+            if args:
+                try:
+                    message = message % args
+                except (TypeError, ValueError):
+                    message = f"{message} {args!r}"
+            self._message = message
+        return message
+    
+    @property
+    def exception(self) -> Optional[str]:
+        """
+        Get the formatted traceback of the logged exception.
+        
+        Returns:
+            Optional[str]: The traceback, or None if no exception was logged.
+        """
+        # Entries are read by several threads at once, so the traceback is
+        # kept rather than cleared once it has been formatted
+        traceback_exception = self._traceback
+        if self._exception is None and traceback_exception is not None:
+            self._exception = "".join(traceback_exception.format())
+        return self._exception
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the entry to a dictionary.
+        
+        Returns:
+            Dict[str, Any]: The entry fields, including the exception if any.
+        """
+        result = {
+            "timestamp": self.timestamp,
+            "level": self.level,
+            "logger": self.logger,
+            "message": self.message,
+            "module": self.module,
+            "function": self.function,
+            "line": self.line
+        }
+        exception = self.exception
+        if exception is not None:
+            result["exception"] = exception
+        return result
+
+
+class _MemoryHandler(logging.Handler):
+    """
+    A log handler that captures records in a logging plugin's in-memory buffer.
+    """
+    
+    def __init__(self, plugin: "LoggingPlugin"):
+        super().__init__()
+        self.plugin = plugin
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        self.plugin.add_log_entry(record)
+
 
 class LoggingPlugin(BasePlugin):
     """
@@ -45,8 +238,21 @@ class LoggingPlugin(BasePlugin):
         self._log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         self._log_dir = "logs"
         self._file_handler = None
-        self._log_entries = []
+        self._file_buffer_capacity = 512
         self._max_log_entries = 1000
+        self._log_entries: Deque[LogEntry] = deque(maxlen=self._max_log_entries)
+        # Creation times in whole microseconds parallel to _log_entries, for
+        # range queries (see _to_microseconds)
+        self._log_times: Deque[int] = deque(maxlen=self._max_log_entries)
+        # Numeric levels parallel to _log_entries, for level filtering
+        self._log_levels: Deque[int] = deque(maxlen=self._max_log_entries)
+        # Number of entries in _log_times earlier than the entry before them.
+        # Records from different threads, or a clock set back, can arrive out
+        # of time order, and bisection is only used while this is zero.
+        self._log_time_inversions = 0
+        # Guards the buffer deques, which are appended to from any thread
+        # that logs, so they always stay the same length
+        self._log_lock = threading.Lock()
     
     def initialize(self) -> bool:
         """
@@ -64,8 +270,15 @@ class LoggingPlugin(BasePlugin):
                 self._log_format = config["log_format"]
             if "log_dir" in config:
                 self._log_dir = config["log_dir"]
+            if "file_buffer_capacity" in config:
+                self._file_buffer_capacity = int(config["file_buffer_capacity"])
             if "max_log_entries" in config:
                 self._max_log_entries = int(config["max_log_entries"])
+                with self._log_lock:
+                    self._log_entries = deque(self._log_entries, maxlen=self._max_log_entries)
+                    self._log_times = deque(self._log_times, maxlen=self._max_log_entries)
+                    self._log_levels = deque(self._log_levels, maxlen=self._max_log_entries)
+                    self._log_time_inversions = _count_time_inversions(self._log_times)
             
             # Ensure log directory exists
             os.makedirs(self._log_dir, exist_ok=True)
@@ -74,11 +287,18 @@ class LoggingPlugin(BasePlugin):
             log_filename = self._get_log_filename()
             self._log_file = os.path.join(self._log_dir, log_filename)
             
-            # Create file handler
-            self._file_handler = logging.FileHandler(self._log_file)
-            self._file_handler.setLevel(self._log_level)
+            # Create file handler. Records are buffered and written in batches;
+            # errors and above flush the buffer immediately.
+            file_target = logging.FileHandler(self._log_file)
+            file_target.setLevel(self._log_level)
             formatter = logging.Formatter(self._log_format)
-            self._file_handler.setFormatter(formatter)
+            file_target.setFormatter(formatter)
+            self._file_handler = logging.handlers.MemoryHandler(
+                capacity=self._file_buffer_capacity,
+                flushLevel=logging.ERROR,
+                target=file_target
+            )
+            self._file_handler.setLevel(self._log_level)
             
             # Add file handler to root logger
             root_logger = logging.getLogger()
@@ -100,17 +320,8 @@ class LoggingPlugin(BasePlugin):
         """
         Register custom log handlers.
         """
-        # Create a custom handler to capture logs in memory
-        class MemoryHandler(logging.Handler):
-            def __init__(self, plugin):
-                super().__init__()
-                self.plugin = plugin
-            
-            def emit(self, record):
-                self.plugin.add_log_entry(record)
-        
-        # Add the memory handler to the root logger
-        memory_handler = MemoryHandler(self)
+        # Add a handler capturing logs in memory to the root logger
+        memory_handler = _MemoryHandler(self)
         memory_handler.setLevel(self._log_level)
         root_logger = logging.getLogger()
         root_logger.addHandler(memory_handler)
@@ -127,7 +338,13 @@ class LoggingPlugin(BasePlugin):
             if self._file_handler:
                 root_logger = logging.getLogger()
                 root_logger.removeHandler(self._file_handler)
+                
+                # Write out buffered records before closing the file
+                file_target = self._file_handler.target
+                self._file_handler.flush()
                 self._file_handler.close()
+                if file_target:
+                    file_target.close()
             
             logger.info("Logging plugin shut down.")
             self._enabled = False
@@ -147,15 +364,7 @@ class LoggingPlugin(BasePlugin):
         Returns:
             int: The logging level.
         """
-        level_map = {
-            "debug": logging.DEBUG,
-            "info": logging.INFO,
-            "warning": logging.WARNING,
-            "error": logging.ERROR,
-            "critical": logging.CRITICAL
-        }
-        
-        return level_map.get(level_str.lower(), logging.INFO)
+        return LOG_LEVELS.get(level_str.lower(), logging.INFO)
     
     def _get_log_filename(self) -> str:
         """
@@ -164,8 +373,14 @@ class LoggingPlugin(BasePlugin):
         Returns:
             str: The log filename.
         """
-        now = datetime.now()
-        return f"myproject_{now.strftime('%Y-%m-%d')}.log"
+        today = date.today()
+        ordinal = today.toordinal()
+        filename = _log_filename_cache.get(ordinal)
+        if filename is None:
+            filename = f"myproject_{today.isoformat()}.log"
+            _log_filename_cache.clear()
+            _log_filename_cache[ordinal] = filename
+        return filename
     
     def add_log_entry(self, record: logging.LogRecord) -> None:
         """
@@ -174,25 +389,21 @@ class LoggingPlugin(BasePlugin):
         Args:
             record (logging.LogRecord): The log record to add.
         """
-        entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno
-        }
-        
-        # Add exception info if available
-        if record.exc_info:
-            import traceback
-            entry["exception"] = "".join(traceback.format_exception(*record.exc_info))
+        entry = LogEntry(record)
+        created = _to_microseconds(record.created)
         
-        # Add to in-memory buffer with rotation
-        self._log_entries.append(entry)
-        if len(self._log_entries) > self._max_log_entries:
-            self._log_entries.pop(0)
+        # Add to in-memory buffer; the deque drops the oldest entry when full
+        with self._log_lock:
+            times = self._log_times
+            if len(times) == times.maxlen and len(times) > 1 and times[1] < times[0]:
+                # The oldest entry is about to be dropped, and its successor with it
+                # stops being out of order
+                self._log_time_inversions -= 1
+            if times and created < times[-1] and times.maxlen != 1:
+                self._log_time_inversions += 1
+            self._log_entries.append(entry)
+            times.append(created)
+            self._log_levels.append(record.levelno)
     
     def get_logs(self, 
                 level: Optional[str] = None, 
@@ -205,35 +416,96 @@ class LoggingPlugin(BasePlugin):
         
         Args:
             level (Optional[str]): Filter by log level.
-            limit (int): Maximum number of logs to return.
+            limit (int): Maximum number of logs to return; 0 or less returns
+                all matching logs.
             start_time (Optional[str]): Filter logs after this ISO timestamp.
             end_time (Optional[str]): Filter logs before this ISO timestamp.
             
         Returns:
             List[Dict[str, Any]]: The filtered log entries.
         """
-        result = self._log_entries.copy()
+        # Work on a consistent snapshot, as other threads keep logging
+        with self._log_lock:
+            entries = list(self._log_entries)
+            times = list(self._log_times)
+            levels = list(self._log_levels)
+            in_order = self._log_time_inversions == 0
         
-        # Apply filters
-        if level:
-            result = [entry for entry in result if entry["level"].lower() == level.lower()]
-        
-        if start_time:
-            start_dt = datetime.fromisoformat(start_time)
-            result = [
-                entry for entry in result 
-                if datetime.fromisoformat(entry["timestamp"]) >= start_dt
+        start = 0
+        end = len(times)
+        if in_order:
+            # Entries are in time order, so the time range maps to a
+            # contiguous slice of the buffer that can be found by bisection
+            if start_time:
+                start = bisect.bisect_left(times, _iso_to_microseconds(start_time))
+            if end_time:
+                end = bisect.bisect_right(times, _iso_to_microseconds(end_time))
+        elif start_time or end_time:
+            # Otherwise check every entry against the range
+            low = _iso_to_microseconds(start_time) if start_time else None
+            high = _iso_to_microseconds(end_time) if end_time else None
+            window = [
+                index for index, created in enumerate(times)
+                if (low is None or created >= low) and (high is None or created <= high)
             ]
+            entries = [entries[index] for index in window]
+            levels = [levels[index] for index in window]
+            end = len(window)
         
-        if end_time:
-            end_dt = datetime.fromisoformat(end_time)
-            result = [
-                entry for entry in result 
-                if datetime.fromisoformat(entry["timestamp"]) <= end_dt
-            ]
+        if start >= end:
+            return []
+        if limit <= 0:
+            limit = end - start
+        
+        # Without a level filter the result is just the tail of the window
+        if not level:
+            return [entry.to_dict() for entry in entries[max(start, end - limit):end]]
         
-        # Apply limit
-        return result[-limit:]
+        level_no = self._resolve_level_filter(level)
+        if level_no is None:
+            return []
+        
+        # Walk the window newest-first and stop once the limit is reached
+        result: Deque[LogEntry] = deque()
+        for entry, entry_level in zip(reversed(entries[start:end]), reversed(levels[start:end])):
+            if entry_level == level_no:
+                result.appendleft(entry)
+                if len(result) >= limit:
+                    break
+        
+        return [entry.to_dict() for entry in result]
+    
+    def _iter_text_lines(self, entries: List[LogEntry]) -> Iterator[str]:
+        """
+        Iterate over log entries as lines of plain text.
+        
+        Args:
+            entries (List[LogEntry]): The entries to format.
+            
+        Yields:
+            str: One line per entry, followed by its traceback if it has one.
+        """
+        for entry in entries:
+            yield f"{entry.timestamp} [{entry.level}] {entry.logger}: {entry.message}\n"
+            exception = entry.exception
+            if exception is not None:
+                yield f"{exception}\n"
+    
+    def _resolve_level_filter(self, level: str) -> Optional[int]:
+        """
+        Resolve a level name to its numeric logging level.
+        
+        Args:
+            level (str): The level name, in any case.
+            
+        Returns:
+            Optional[int]: The numeric level, or None if the name is not registered.
+        """
+        for name in (level.upper(), level):
+            level_no = logging.getLevelName(name)
+            if isinstance(level_no, int):
+                return level_no
+        return None
     
     def export_logs(self, format: str = "json", path: Optional[str] = None) -> str:
         """
@@ -252,35 +524,36 @@ class LoggingPlugin(BasePlugin):
             filename = f"logs_export_{now.strftime('%Y%m%d_%H%M%S')}.{format}"
             path = os.path.join(self._log_dir, filename)
         
+        # Export a snapshot, as other threads keep logging while the file is written
+        with self._log_lock:
+            entries = list(self._log_entries)
+        
         try:
             if format.lower() == "json":
-                with open(path, "w") as f:
-                    json.dump(self._log_entries, f, indent=2)
+                rows = [entry.to_dict() for entry in entries]
+                if ORJSON_AVAILABLE:
+                    with open(path, "wb") as f:
+                        f.write(orjson.dumps(rows))
+                else:
+                    with open(path, "w") as f:
+                        json.dump(rows, f, separators=(",", ":"))
             
             elif format.lower() == "csv":
                 import csv
                 with open(path, "w", newline="") as f:
-                    fieldnames = [
-                        "timestamp", "level", "logger", "message", 
+                    # Column names double as LogEntry attribute names
+                    fieldnames = (
+                        "timestamp", "level", "logger", "message",
                         "module", "function", "line"
-                    ]
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    
-                    for entry in self._log_entries:
-                        # Filter out keys not in fieldnames
-                        row = {k: v for k, v in entry.items() if k in fieldnames}
-                        writer.writerow(row)
+                    )
+                    get_row = attrgetter(*fieldnames)
+                    writer = csv.writer(f)
+                    writer.writerow(fieldnames)
+                    writer.writerows(get_row(entry) for entry in entries)
             
             elif format.lower() == "text":
                 with open(path, "w") as f:
-                    for entry in self._log_entries:
-                        f.write(
-                            f"{entry['timestamp']} [{entry['level']}] "
-                            f"{entry['logger']}: {entry['message']}\n"
-                        )
-                        if "exception" in entry:
-                            f.write(f"{entry['exception']}\n")
+                    f.writelines(self._iter_text_lines(entries))
             
             else:
                 raise ValueError(f"Unsupported export format: {format}")
@@ -2,19 +2,187 @@
 A notification plugin that provides various notification capabilities.
 """
 import logging
-import smtplib
 import time
 import json
 import os
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Dict, Any, List, Optional, Union, Callable
+import sys
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from json.encoder import encode_basestring_ascii
+from typing import TYPE_CHECKING, Deque, Dict, Any, List, Optional, Union, Callable
 
 from myproject.plugins.core.base import BasePlugin
 from myproject.plugins.core.manager import plugin_manager
 
+if TYPE_CHECKING:
+    # Email support is imported on first use (see _send_email_notification)
+    import smtplib
+    from email.message import Message
+
 logger = logging.getLogger(__name__)
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Logging level used to record notifications of each level
+NOTIFICATION_LOG_LEVELS = {
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL
+}
+
+# ANSI formatting for console notifications of each level
+CONSOLE_FORMATTING = {
+    "info": "\033[94m",      # Blue
+    "warning": "\033[93m",   # Yellow
+    "error": "\033[91m",     # Red
+    "critical": "\033[91m\033[1m"  # Bold Red
+}
+CONSOLE_RESET = "\033[0m"
+
+# Slack emoji for notifications of each level
+SLACK_EMOJI = {
+    "info": ":information_source:",
+    "warning": ":warning:",
+    "error": ":x:",
+    "critical": ":fire:"
+}
+
+
+def _build_slack_payload_template() -> str:
+    """
+    Build the JSON text of a Slack notification payload as a format string.
+    
+    The payload structure never changes, so it is serialized once with
+    placeholders for the emoji, subject, message, level and timestamp.
+    
+    Returns:
+        str: The payload template, for use with str.format and JSON-escaped values.
+    """
+    payload = {
+        "text": "@emoji@ *@subject@*",
+        "blocks": [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": "@emoji@ @subject@"
+                }
+            },
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": "@message@"
+                }
+            },
+            {
+                "type": "context",
+                "elements": [
+                    {
+                        "type": "mrkdwn",
+                        "text": "*Level:* @level@ | *Time:* @timestamp@"
+                    }
+                ]
+            }
+        ]
+    }
+    
+    template = json.dumps(payload).replace("{", "{{").replace("}", "}}")
+    for placeholder in ("emoji", "subject", "message", "level", "timestamp"):
+        template = template.replace(f"@{placeholder}@", f"{{{placeholder}}}")
+    return template
+
+
+def _json_escape(value: Any) -> str:
+    """
+    Escape a value for use inside a JSON string literal.
+    
+    Args:
+        value (Any): The value; non-strings are converted with str().
+        
+    Returns:
+        str: The escaped value, without surrounding quotes.
+    """
+    return encode_basestring_ascii(str(value))[1:-1]
+
+
+def _encode_json(value: Any) -> bytes:
+    """
+    Serialize a value to compact JSON bytes, using orjson when available.
+    
+    Args:
+        value (Any): The value to serialize.
+        
+    Returns:
+        bytes: The UTF-8 encoded JSON.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+# Slack notification payload with the per-notification values left as placeholders
+SLACK_PAYLOAD_TEMPLATE = _build_slack_payload_template()
+
+# Headers for JSON request bodies
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Settings required to send email notifications
+SMTP_REQUIRED_SETTINGS = frozenset(("smtp_server", "smtp_port", "smtp_username", "smtp_password"))
+
+# HTML body of email notifications, filled from the notification data
+EMAIL_BODY_TEMPLATE = (
+    "<html>\n"
+    "<body>\n"
+    "    <h2>{subject}</h2>\n"
+    "    <p style=\"font-size: 16px;\">{message}</p>\n"
+    "    <p style=\"color: #666;\">Sent at: {timestamp}</p>\n"
+    "    <p style=\"color: #666;\">Level: {level}</p>\n"
+    "</body>\n"
+    "</html>\n"
+)
+
+# Connect and read timeouts for webhook and Slack requests, in seconds
+HTTP_TIMEOUT = (3, 10)
+
+# Formatted notification timestamp for the current second, keyed by the second
+_timestamp_cache: Dict[int, str] = {}
+
+
+def _format_timestamp(now: float) -> str:
+    """
+    Format a notification timestamp in local time.
+    
+    Notifications sent within the same second share one formatted string.
+    
+    Args:
+        now (float): The POSIX time of the notification.
+        
+    Returns:
+        str: The timestamp, formatted as "%Y-%m-%d %H:%M:%S".
+    """
+    second = int(now)
+    timestamp = _timestamp_cache.get(second)
+    if timestamp is None:
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        _timestamp_cache.clear()
+        _timestamp_cache[second] = timestamp
+    return timestamp
+
 
 class NotificationPlugin(BasePlugin):
     """
@@ -51,8 +219,43 @@ class NotificationPlugin(BasePlugin):
         """
         super().__init__()
         self._notification_handlers = {}
-        self._notifications = []
         self._max_notifications = 100
+        self._notifications: Deque[Dict[str, Any]] = deque(maxlen=self._max_notifications)
+        
+        # SMTP session reused across email notifications
+        self._smtp: Optional["smtplib.SMTP"] = None
+        self._smtp_lock = threading.Lock()
+        self._smtp_messages_sent = 0
+        self._smtp_max_messages_per_connection = 500
+        
+        # Console output; ANSI formatting is only used on a terminal
+        self._console_lock = threading.Lock()
+        self._is_tty = sys.stdout is not None and sys.stdout.isatty()
+        
+        # Threads sending a notification to several channels at once
+        self._dispatch_pool: Optional[ThreadPoolExecutor] = None
+        self._dispatch_pool_size = 0
+        self._dispatch_workers = 8
+        
+        # Channel settings derived from the configuration (see set_config)
+        self._email_configured = False
+        self._smtp_port: Optional[int] = None
+        self._webhook_url: Optional[str] = None
+        self._slack_webhook_url: Optional[str] = None
+        
+        # HTTP session shared by webhook and Slack notifications
+        self._http: Optional["requests.Session"] = None
+        
+        # Webhook notifications waiting to be posted in batches (only used
+        # when webhook_batching is enabled)
+        self._webhook_batching = False
+        self._webhook_queue: Deque[bytes] = deque()
+        self._webhook_batch_size = 50
+        self._webhook_flush_interval = 1.0
+        self._webhook_max_queue = 1000
+        self._webhook_flush_event = threading.Event()
+        self._webhook_stop_event = threading.Event()
+        self._webhook_worker: Optional[threading.Thread] = None
         self._handlers = {
             "email": self._send_email_notification,
             "webhook": self._send_webhook_notification,
@@ -74,8 +277,10 @@ class NotificationPlugin(BasePlugin):
             
             # Create notification directory if specified
             notification_dir = config.get("notification_dir", "notifications")
-            if not os.path.exists(notification_dir):
+            try:
                 os.makedirs(notification_dir, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Failed to create notification directory {notification_dir}: {str(e)}")
             
             # Check if the logging plugin is available
             if not plugin_manager.get_plugin("advanced_logging"):
@@ -84,10 +289,17 @@ class NotificationPlugin(BasePlugin):
                     "Notification events will be logged to the console only."
                 )
             
+            # Open the HTTP session used for webhook and Slack notifications
+            if REQUESTS_AVAILABLE and self._http is None:
+                self._http = self._create_http_session()
+            
             # Register default notification handlers
             for handler_name, handler_func in self._handlers.items():
                 self.register_notification_handler(handler_name, handler_func)
             
+            # Start the dispatch threads, and the webhook batch worker if configured
+            self._apply_worker_config()
+            
             logger.info("Notification plugin initialized")
             self._enabled = True
             return True
@@ -107,6 +319,24 @@ class NotificationPlugin(BasePlugin):
             # Clear handlers
             self._notification_handlers.clear()
             
+            # Close the SMTP session, if one is open
+            with self._smtp_lock:
+                self._close_smtp_connection()
+            
+            # Post any queued webhook notifications and stop the worker
+            self._stop_webhook_worker()
+            
+            # Stop the dispatch threads; notifications still waiting for a
+            # thread are cancelled and reported as failed
+            if self._dispatch_pool is not None:
+                self._dispatch_pool.shutdown(wait=False, cancel_futures=True)
+                self._dispatch_pool = None
+            
+            # Close pooled HTTP connections
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+            
             logger.info("Notification plugin shut down")
             self._enabled = False
             return True
@@ -115,6 +345,98 @@ class NotificationPlugin(BasePlugin):
             logger.error(f"Failed to shutdown notification plugin: {str(e)}")
             return False
     
+    def set_config(self, config: Dict[str, Any]) -> None:
+        """
+        Set the configuration of the plugin.
+        
+        The settings the notification channels check on every notification
+        are derived here once, rather than looked up per notification. If
+        the plugin is already initialized, the dispatch threads and webhook
+        batch worker are adjusted to the new configuration.
+        
+        Args:
+            config (Dict[str, Any]): The configuration to set.
+            
+        Raises:
+            ValueError: If a numeric setting is not a valid integer. The
+                previous configuration is kept in that case.
+        """
+        email_configured = SMTP_REQUIRED_SETTINGS.issubset(config)
+        smtp_port = int(config["smtp_port"]) if email_configured else None
+        smtp_max_messages = int(config.get("smtp_max_messages_per_connection", 500))
+        dispatch_workers = int(config.get("dispatch_workers", 8))
+        webhook_batch_size = int(config.get("webhook_batch_size", 50))
+        webhook_flush_interval = int(config.get("webhook_flush_interval_ms", 1000)) / 1000
+        webhook_max_queue = int(config.get("webhook_max_queue", 1000))
+        
+        super().set_config(config)
+        
+        self._email_configured = email_configured
+        self._smtp_port = smtp_port
+        self._smtp_max_messages_per_connection = smtp_max_messages
+        self._webhook_url = config.get("webhook_url")
+        self._slack_webhook_url = config.get("slack_webhook_url")
+        self._dispatch_workers = dispatch_workers
+        self._webhook_batching = bool(config.get("webhook_batching"))
+        self._webhook_batch_size = webhook_batch_size
+        self._webhook_flush_interval = webhook_flush_interval
+        self._webhook_max_queue = webhook_max_queue
+        
+        if self._enabled:
+            self._apply_worker_config()
+    
+    def _apply_worker_config(self) -> None:
+        """
+        Start, stop or resize the background threads to match the configuration.
+        
+        The dispatch pool is replaced when dispatch_workers changes; the old
+        pool finishes the notifications it is already sending. The webhook
+        batch worker is started or stopped as webhook_batching is turned on
+        or off, and restarted to resize its queue when webhook_max_queue
+        changes.
+        """
+        if self._dispatch_pool is None or self._dispatch_pool_size != self._dispatch_workers:
+            previous_pool = self._dispatch_pool
+            self._dispatch_pool = ThreadPoolExecutor(
+                max_workers=self._dispatch_workers,
+                thread_name_prefix="notification"
+            )
+            self._dispatch_pool_size = self._dispatch_workers
+            if previous_pool is not None:
+                previous_pool.shutdown(wait=False)
+        
+        if self._webhook_worker is not None and (
+            not self._webhook_batching or self._webhook_queue.maxlen != self._webhook_max_queue
+        ):
+            self._stop_webhook_worker()
+        
+        if self._webhook_batching:
+            self._start_webhook_worker()
+    
+    def _create_http_session(self) -> "requests.Session":
+        """
+        Create the HTTP session used for webhook and Slack notifications.
+        
+        The session keeps connections to webhook hosts alive between
+        notifications and retries requests that fail to connect or are
+        rejected by an overloaded gateway.
+        
+        Returns:
+            requests.Session: The HTTP session.
+        """
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"POST"})
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
     def register_notification_handler(
         self, name: str, handler: Callable[[Dict[str, Any]], bool]
     ) -> None:
@@ -171,14 +493,17 @@ class NotificationPlugin(BasePlugin):
         Returns:
             Dict[str, bool]: A dictionary of channel names to success/failure status.
         """
-        if not self.enabled:
+        # The flag is read directly; it is set by initialize and shutdown and
+        # by the enabled property used by the plugin manager
+        if not self._enabled:
             logger.warning("Notification plugin is not enabled")
             return {channel: False for channel in (channels or self._notification_handlers.keys())}
         
         # Create notification data
+        now = time.time()
         notification_data = {
-            "id": str(int(time.time() * 1000)),
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "id": str(int(now * 1000)),
+            "timestamp": _format_timestamp(now),
             "subject": subject,
             "message": message,
             "level": level,
@@ -187,16 +512,7 @@ class NotificationPlugin(BasePlugin):
         
         # Log the notification
         log_message = f"Notification [{level}]: {subject} - {message}"
-        if level == "info":
-            logger.info(log_message)
-        elif level == "warning":
-            logger.warning(log_message)
-        elif level == "error":
-            logger.error(log_message)
-        elif level == "critical":
-            logger.critical(log_message)
-        else:
-            logger.info(log_message)
+        logger.log(NOTIFICATION_LOG_LEVELS.get(level, logging.INFO), log_message)
         
         # Store the notification in memory
         self._store_notification(notification_data)
@@ -205,32 +521,73 @@ class NotificationPlugin(BasePlugin):
         if not channels:
             channels = list(self._notification_handlers.keys())
         
-        # Send notification through each channel
+        # Send notification through each channel. The channels are
+        # independent, so with more than one they are sent concurrently.
+        dispatch_pool = self._dispatch_pool if len(channels) > 1 else None
         results = {}
+        pending: Dict[str, Future] = {}
         for channel in channels:
-            if channel in self._notification_handlers:
-                try:
-                    handler = self._notification_handlers[channel]
-                    results[channel] = handler(notification_data)
-                except Exception as e:
-                    logger.error(f"Failed to send notification via {channel}: {str(e)}")
-                    results[channel] = False
-            else:
+            handler = self._notification_handlers.get(channel)
+            if handler is None:
                 logger.warning(f"Notification channel {channel} not registered")
                 results[channel] = False
+            else:
+                future = None
+                if dispatch_pool is not None:
+                    try:
+                        future = dispatch_pool.submit(
+                            self._run_notification_handler, channel, handler, notification_data
+                        )
+                    except RuntimeError:
+                        # The pool was shut down or replaced since it was read;
+                        # send from this thread instead
+                        pass
+                
+                if future is not None:
+                    pending[channel] = future
+                    results[channel] = False
+                else:
+                    results[channel] = self._run_notification_handler(channel, handler, notification_data)
+        
+        for channel, future in pending.items():
+            try:
+                results[channel] = future.result()
+            except CancelledError:
+                logger.error(f"Failed to send notification via {channel}: cancelled at shutdown")
         
         return results
     
+    def _run_notification_handler(
+        self, channel: str, handler: Callable[[Dict[str, Any]], bool], notification_data: Dict[str, Any]
+    ) -> bool:
+        """
+        Send a notification through a channel handler.
+        
+        Args:
+            channel (str): The name of the channel.
+            handler (Callable[[Dict[str, Any]], bool]): The channel handler.
+            notification_data (Dict[str, Any]): The notification data.
+            
+        Returns:
+            bool: The handler result, or False if the handler raised.
+        """
+        try:
+            return handler(notification_data)
+        except Exception as e:
+            logger.error(f"Failed to send notification via {channel}: {str(e)}")
+            return False
+    
     def _store_notification(self, notification_data: Dict[str, Any]) -> None:
         """
-        Store a notification in the in-memory list.
+        Store a notification in the in-memory buffer.
+        
+        The buffer holds the most recent notifications; once it is full the
+        oldest one is dropped.
         
         Args:
             notification_data (Dict[str, Any]): The notification data to store.
         """
         self._notifications.append(notification_data)
-        if len(self._notifications) > self._max_notifications:
-            self._notifications.pop(0)
     
     def get_notifications(
         self,
@@ -244,27 +601,42 @@ class NotificationPlugin(BasePlugin):
         
         Args:
             level (Optional[str]): Filter by notification level.
-            limit (int): Maximum number of notifications to return.
+            limit (int): Maximum number of notifications to return; 0 or less
+                returns all matching notifications.
             start_time (Optional[str]): Filter notifications after this time.
             end_time (Optional[str]): Filter notifications before this time.
             
         Returns:
             List[Dict[str, Any]]: The filtered notifications.
         """
-        result = self._notifications.copy()
-        
-        # Apply filters
-        if level:
-            result = [n for n in result if n["level"] == level]
-        
-        if start_time:
-            result = [n for n in result if n["timestamp"] >= start_time]
-        
-        if end_time:
-            result = [n for n in result if n["timestamp"] <= end_time]
+        # Copy the buffer first, as notifications can be sent from other threads
+        notifications = list(self._notifications)
+        
+        # A non-positive limit has always meant "no limit" (the original
+        # result[-limit:] slice returned everything for 0), and get_logs in
+        # the logging plugin treats its limit the same way
+        if limit <= 0:
+            limit = len(notifications)
+        
+        # Without filters the result is just the newest `limit` notifications
+        if not level and not start_time and not end_time:
+            return notifications[-limit:] if limit else []
+        
+        # Walk the notifications newest-first and stop once the limit is reached
+        result: Deque[Dict[str, Any]] = deque()
+        for notification in reversed(notifications):
+            if level and notification["level"] != level:
+                continue
+            if start_time and notification["timestamp"] < start_time:
+                continue
+            if end_time and notification["timestamp"] > end_time:
+                continue
+            
+            result.appendleft(notification)
+            if len(result) >= limit:
+                break
         
-        # Apply limit
-        return result[-limit:]
+        return list(result)
     
     def _send_email_notification(self, notification_data: Dict[str, Any]) -> bool:
         """
@@ -276,41 +648,28 @@ class NotificationPlugin(BasePlugin):
         Returns:
             bool: True if the notification was sent successfully, False otherwise.
         """
-        config = self.get_config()
-        
         # Check if email configuration is available
-        if not all(key in config for key in ["smtp_server", "smtp_port", "smtp_username", "smtp_password"]):
+        if not self._email_configured:
             logger.warning("Email notification configuration incomplete")
             return False
         
+        config = self.get_config()
+        
         try:
             # Create message
-            msg = MIMEMultipart()
+            # Imported here so plugins that never send email do not load it
+            from email.mime.text import MIMEText
+            
+            # The body is the only part, so no multipart container is needed
+            body = EMAIL_BODY_TEMPLATE.format_map(notification_data)
+            msg = MIMEText(body, "html", "utf-8")
             msg["From"] = config.get("email_from", config["smtp_username"])
             msg["To"] = notification_data.get("email_to", config.get("email_to", "admin@example.com"))
             msg["Subject"] = notification_data["subject"]
             
-            # Add body
-            body = f"""
-            <html>
-            <body>
-                <h2>{notification_data['subject']}</h2>
-                <p style="font-size: 16px;">{notification_data['message']}</p>
-                <p style="color: #666;">Sent at: {notification_data['timestamp']}</p>
-                <p style="color: #666;">Level: {notification_data['level']}</p>
-            </body>
-            </html>
-            """
-            msg.attach(MIMEText(body, "html"))
-            
-            # Connect to server
-            server = smtplib.SMTP(config["smtp_server"], int(config["smtp_port"]))
-            server.starttls()
-            server.login(config["smtp_username"], config["smtp_password"])
-            
-            # Send email
-            server.send_message(msg)
-            server.quit()
+            # Send email over the shared session
+            with self._smtp_lock:
+                self._send_smtp_message(msg, config)
             
             logger.info(f"Email notification sent to {msg['To']}")
             return True
@@ -319,44 +678,147 @@ class NotificationPlugin(BasePlugin):
             logger.error(f"Failed to send email notification: {str(e)}")
             return False
     
+    def _send_smtp_message(self, msg: "Message", config: Dict[str, Any]) -> None:
+        """
+        Send a message over the shared SMTP session.
+        
+        The session is opened on first use and kept open between messages.
+        If the server has dropped it, a new session is opened and the message
+        is sent again. The session is closed after a configurable number of
+        messages, as mail servers commonly limit messages per connection.
+        
+        Must be called with the SMTP lock held.
+        
+        Args:
+            msg (Message): The message to send.
+            config (Dict[str, Any]): The plugin configuration.
+        """
+        import smtplib
+        
+        try:
+            self._get_smtp_connection(config).send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            self._close_smtp_connection()
+            self._get_smtp_connection(config).send_message(msg)
+        except Exception:
+            # Leave the session in an unknown state behind
+            self._close_smtp_connection()
+            raise
+        
+        self._smtp_messages_sent += 1
+        if self._smtp_messages_sent >= self._smtp_max_messages_per_connection:
+            self._close_smtp_connection()
+    
+    def _get_smtp_connection(self, config: Dict[str, Any]) -> "smtplib.SMTP":
+        """
+        Get the shared SMTP session, opening and authenticating it if needed.
+        
+        Must be called with the SMTP lock held.
+        
+        Args:
+            config (Dict[str, Any]): The plugin configuration.
+            
+        Returns:
+            smtplib.SMTP: The SMTP session.
+        """
+        if self._smtp is None:
+            import smtplib
+            
+            server = smtplib.SMTP(config["smtp_server"], self._smtp_port)
+            try:
+                server.starttls()
+                server.login(config["smtp_username"], config["smtp_password"])
+            except Exception:
+                server.close()
+                raise
+            
+            self._smtp = server
+            self._smtp_messages_sent = 0
+        
+        return self._smtp
+    
+    def _close_smtp_connection(self) -> None:
+        """
+        Close the shared SMTP session, if one is open.
+        
+        Must be called with the SMTP lock held.
+        """
+        if self._smtp is None:
+            return
+        
+        import smtplib
+        
+        server = self._smtp
+        self._smtp = None
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+    
     def _send_webhook_notification(self, notification_data: Dict[str, Any]) -> bool:
         """
         Send a webhook notification.
         
+        With webhook_batching enabled, notifications other than critical ones
+        are queued and posted by the batch worker.
+        
         Args:
             notification_data (Dict[str, Any]): The notification data.
             
         Returns:
-            bool: True if the notification was sent successfully, False otherwise.
+            bool: True if the notification was sent or queued successfully, False otherwise.
         """
-        config = self.get_config()
-        
         # Check if webhook configuration is available
-        if "webhook_url" not in config:
+        if self._webhook_url is None:
             logger.warning("Webhook notification configuration incomplete")
             return False
         
-        try:
-            import requests
-            
-            # Prepare payload
-            payload = {
-                "id": notification_data["id"],
-                "timestamp": notification_data["timestamp"],
-                "subject": notification_data["subject"],
-                "message": notification_data["message"],
-                "level": notification_data["level"]
-            }
+        # Prepare payload
+        body = _encode_json({
+            "id": notification_data["id"],
+            "timestamp": notification_data["timestamp"],
+            "subject": notification_data["subject"],
+            "message": notification_data["message"],
+            "level": notification_data["level"]
+        })
+        
+        # Queue for the batch worker; critical notifications are never delayed
+        if self._webhook_worker is not None and notification_data["level"] != "critical":
+            if len(self._webhook_queue) == self._webhook_queue.maxlen:
+                logger.warning("Webhook notification queue full, dropping oldest notification")
+            self._webhook_queue.append(body)
+            if len(self._webhook_queue) >= self._webhook_batch_size:
+                self._webhook_flush_event.set()
+            return True
+        
+        return self._post_webhook(self._webhook_url, body)
+    
+    def _post_webhook(self, url: str, body: bytes) -> bool:
+        """
+        Post a payload to a webhook.
+        
+        Args:
+            url (str): The webhook URL.
+            body (bytes): The JSON-encoded payload.
             
+        Returns:
+            bool: True if the payload was accepted, False otherwise.
+        """
+        if self._http is None:
+            logger.error("Failed to send webhook notification: requests is not available")
+            return False
+        
+        try:
             # Send webhook
-            response = requests.post(
-                config["webhook_url"],
-                json=payload,
-                headers={"Content-Type": "application/json"}
+            response = self._http.post(
+                url,
+                data=body,
+                headers=JSON_HEADERS,
+                timeout=HTTP_TIMEOUT
             )
             
             if response.status_code < 400:
-                logger.info(f"Webhook notification sent to {config['webhook_url']}")
+                logger.info(f"Webhook notification sent to {url}")
                 return True
             else:
                 logger.warning(
@@ -369,6 +831,66 @@ class NotificationPlugin(BasePlugin):
             logger.error(f"Failed to send webhook notification: {str(e)}")
             return False
     
+    def _start_webhook_worker(self) -> None:
+        """
+        Start the background thread that posts webhook notifications in batches.
+        
+        Queued notifications are posted as a single {"deliveries": [...]}
+        request once webhook_batch_size of them are waiting, or every
+        webhook_flush_interval_ms otherwise. When more than webhook_max_queue
+        are waiting, the oldest are dropped.
+        """
+        if self._webhook_worker is not None:
+            return
+        
+        self._webhook_queue = deque(self._webhook_queue, maxlen=self._webhook_max_queue)
+        
+        self._webhook_stop_event.clear()
+        self._webhook_worker = threading.Thread(
+            target=self._run_webhook_worker,
+            name="notification-webhook",
+            daemon=True
+        )
+        self._webhook_worker.start()
+    
+    def _stop_webhook_worker(self) -> None:
+        """
+        Stop the webhook batch thread after it has posted the queued notifications.
+        """
+        if self._webhook_worker is None:
+            return
+        
+        self._webhook_stop_event.set()
+        self._webhook_flush_event.set()
+        self._webhook_worker.join(timeout=10)
+        self._webhook_worker = None
+    
+    def _run_webhook_worker(self) -> None:
+        """
+        Post queued webhook notifications until the worker is stopped.
+        """
+        while not self._webhook_stop_event.is_set():
+            self._webhook_flush_event.wait(self._webhook_flush_interval)
+            self._webhook_flush_event.clear()
+            self._flush_webhook_queue()
+        
+        # Post whatever was queued before the stop
+        self._flush_webhook_queue()
+    
+    def _flush_webhook_queue(self) -> None:
+        """
+        Post all queued webhook notifications, in batches of at most the batch size.
+        """
+        url = self._webhook_url
+        
+        while self._webhook_queue:
+            batch = []
+            while self._webhook_queue and len(batch) < self._webhook_batch_size:
+                batch.append(self._webhook_queue.popleft())
+            
+            if url:
+                self._post_webhook(url, b'{"deliveries":[' + b",".join(batch) + b"]}")
+    
     def _send_slack_notification(self, notification_data: Dict[str, Any]) -> bool:
         """
         Send a Slack notification.
@@ -379,60 +901,34 @@ class NotificationPlugin(BasePlugin):
         Returns:
             bool: True if the notification was sent successfully, False otherwise.
         """
-        config = self.get_config()
-        
         # Check if Slack configuration is available
-        if "slack_webhook_url" not in config:
+        if self._slack_webhook_url is None:
             logger.warning("Slack notification configuration incomplete")
             return False
         
+        if self._http is None:
+            logger.error("Failed to send Slack notification: requests is not available")
+            return False
+        
         try:
-            import requests
-            
             # Get emoji based on level
-            emoji_map = {
-                "info": ":information_source:",
-                "warning": ":warning:",
-                "error": ":x:",
-                "critical": ":fire:"
-            }
-            emoji = emoji_map.get(notification_data["level"], ":bell:")
+            emoji = SLACK_EMOJI.get(notification_data["level"], ":bell:")
             
             # Prepare payload
-            payload = {
-                "text": f"{emoji} *{notification_data['subject']}*",
-                "blocks": [
-                    {
-                        "type": "header",
-                        "text": {
-                            "type": "plain_text",
-                            "text": f"{emoji} {notification_data['subject']}"
-                        }
-                    },
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": notification_data["message"]
-                        }
-                    },
-                    {
-                        "type": "context",
-                        "elements": [
-                            {
-                                "type": "mrkdwn",
-                                "text": f"*Level:* {notification_data['level']} | *Time:* {notification_data['timestamp']}"
-                            }
-                        ]
-                    }
-                ]
-            }
+            body = SLACK_PAYLOAD_TEMPLATE.format(
+                emoji=_json_escape(emoji),
+                subject=_json_escape(notification_data["subject"]),
+                message=_json_escape(notification_data["message"]),
+                level=_json_escape(notification_data["level"]),
+                timestamp=_json_escape(notification_data["timestamp"])
+            )
             
             # Send to Slack
-            response = requests.post(
-                config["slack_webhook_url"],
-                json=payload,
-                headers={"Content-Type": "application/json"}
+            response = self._http.post(
+                self._slack_webhook_url,
+                data=body.encode("utf-8"),
+                headers=JSON_HEADERS,
+                timeout=HTTP_TIMEOUT
             )
             
             if response.status_code < 400:
@@ -460,20 +956,22 @@ class NotificationPlugin(BasePlugin):
             bool: True if the notification was sent successfully, False otherwise.
         """
         try:
-            level_formatting = {
-                "info": "\033[94m",      # Blue
-                "warning": "\033[93m",   # Yellow
-                "error": "\033[91m",     # Red
-                "critical": "\033[91m\033[1m"  # Bold Red
-            }
-            reset = "\033[0m"
-            
             level = notification_data["level"]
-            formatting = level_formatting.get(level, "")
+            if self._is_tty:
+                formatting = CONSOLE_FORMATTING.get(level, "")
+                reset = CONSOLE_RESET
+            else:
+                formatting = reset = ""
+            
+            text = (
+                f"\n{formatting}[{level.upper()}] {notification_data['subject']}{reset}\n"
+                f"Time: {notification_data['timestamp']}\n"
+                f"Message: {notification_data['message']}\n\n"
+            )
             
-            print(f"\n{formatting}[{level.upper()}] {notification_data['subject']}{reset}")
-            print(f"Time: {notification_data['timestamp']}")
-            print(f"Message: {notification_data['message']}\n")
+            # Write in one call so notifications from dispatch threads do not interleave
+            with self._console_lock:
+                sys.stdout.write(text)
             
             return True
         
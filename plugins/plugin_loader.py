@@ -2,14 +2,20 @@
 Plugin loader module that simplifies loading plugins in the main application.
 """
 import os
+import inspect
 import logging
 import importlib.util
-from typing import List, Dict, Any, Optional
+from types import ModuleType
+from typing import List, Dict, Any, Optional, Tuple
 
+from .core.base import PluginInterface
 from .core.manager import plugin_manager
 
 logger = logging.getLogger(__name__)
 
+# Modules loaded by load_plugin_from_file, keyed by file path, with the file's mtime
+_LOAD_CACHE: Dict[str, Tuple[int, ModuleType]] = {}
+
 
 def initialize_plugin_system(plugin_directories: List[str] = None) -> None:
     """
@@ -29,14 +35,13 @@ def initialize_plugin_system(plugin_directories: List[str] = None) -> None:
     
     # Register plugin directories
     for directory in plugin_directories:
-        if os.path.isdir(directory):
-            plugin_manager.register_plugin_directory(directory)
-        else:
-            try:
-                os.makedirs(directory, exist_ok=True)
-                plugin_manager.register_plugin_directory(directory)
-            except Exception as e:
-                logger.warning(f"Failed to create plugin directory {directory}: {str(e)}")
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to create plugin directory {directory}: {str(e)}")
+            continue
+        
+        plugin_manager.register_plugin_directory(directory)
 
 
 def discover_and_load_plugins(
@@ -53,14 +58,9 @@ def discover_and_load_plugins(
     Returns:
         Dict[str, bool]: Dictionary of plugin names to success/failure status.
     """
-    # Discover plugins
-    discovered_plugins = plugin_manager.discover_plugins()
-    
-    # Filter out excluded plugins
-    if excluded_plugins:
-        for plugin_name in excluded_plugins:
-            if plugin_name in discovered_plugins:
-                del discovered_plugins[plugin_name]
+    # Discover plugins, filtering out excluded ones
+    excluded = frozenset(excluded_plugins) if excluded_plugins else None
+    discovered_plugins = plugin_manager.discover_plugins(exclude=excluded)
     
     # Load plugins
     results = plugin_manager.load_plugins(discovered_plugins)
@@ -86,29 +86,35 @@ def load_plugin_from_file(file_path: str, auto_enable: bool = True) -> bool:
         bool: True if the plugin was loaded successfully, False otherwise.
     """
     try:
-        # Get the module name from the file path
-        module_name = os.path.splitext(os.path.basename(file_path))[0]
-        
-        # Load the module
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
-        if spec is None or spec.loader is None:
-            logger.error(f"Failed to load plugin from {file_path}: Invalid module specification")
-            return False
-        
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        # Reuse the module from an earlier load if the file has not changed
+        mtime = os.stat(file_path).st_mtime_ns
+        cached = _LOAD_CACHE.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            module = cached[1]
+        else:
+            # Get the module name from the file path
+            module_name = os.path.splitext(os.path.basename(file_path))[0]
+            
+            # Load the module
+            spec = importlib.util.spec_from_file_location(module_name, file_path)
+            if spec is None or spec.loader is None:
+                logger.error(f"Failed to load plugin from {file_path}: Invalid module specification")
+                return False
+            
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _LOAD_CACHE[file_path] = (mtime, module)
         
-        # Look for plugin classes in the module
-        from .core.base import PluginInterface
+        # Look for plugin classes in the module. Abstract classes such as
+        # PluginInterface and an imported BasePlugin cannot be loaded.
         plugin_class = None
         
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
+        for attr_name, attr in module.__dict__.items():
             if (
-                isinstance(attr, type) 
-                and issubclass(attr, PluginInterface) 
-                and attr.__name__ != "PluginInterface"
-                and not attr.__name__.startswith("_")
+                not attr_name.startswith("_")
+                and isinstance(attr, type)
+                and issubclass(attr, PluginInterface)
+                and not inspect.isabstract(attr)
             ):
                 plugin_class = attr
                 break
@@ -118,15 +124,15 @@ def load_plugin_from_file(file_path: str, auto_enable: bool = True) -> bool:
             return False
         
         # Load the plugin
-        result = plugin_manager.load_plugin(plugin_class)
+        instance = plugin_manager.load_plugin_instance(plugin_class)
+        if instance is None:
+            return False
         
         # Enable the plugin if requested
-        if result and auto_enable:
-            # Create an instance to get the plugin name
-            instance = plugin_class()
+        if auto_enable:
             plugin_manager.enable_plugin(instance.name)
         
-        return result
+        return True
     
     except Exception as e:
         logger.error(f"Failed to load plugin from {file_path}: {str(e)}")
@@ -21,21 +21,35 @@ import sys
 import time
 import logging
 import argparse
+import heapq
+import itertools
 import json
+import queue
+import random
 import subprocess
+import shlex
 import signal
 import threading
 import smtplib
-import schedule
 import requests
 import psutil
 import socket
+from collections import deque
 from datetime import datetime, timedelta
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from contextlib import contextmanager
-from functools import wraps
+from types import SimpleNamespace
+from functools import partial, wraps
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Setup logging
 logging.basicConfig(
@@ -118,17 +132,27 @@ DEFAULT_CONFIG = {
     "general": {
         "status_file": "data/scheduler_status.json",
         "python_executable": sys.executable,
-        "max_concurrent_tasks": 2
+        "max_concurrent_tasks": 2,
+        "metrics_host": "127.0.0.1",
+        "metrics_port": None  # set to serve /metrics and /health over HTTP
     }
 }
 
 # Global variables
-running_processes = {}
-task_statuses = {}
+running_processes = {}  # (task name, process id) -> process, for each running task
 config = {}
 shutdown_event = threading.Event()
 
-# Task runtime status tracking
+# Worker threads running scheduled tasks (created in schedule_tasks)
+task_runner = None
+
+# HTTP server for /metrics and /health (started in main if metrics_port is set)
+metrics_server = None
+
+# Queue order for each task priority; lower values run first
+TASK_PRIORITIES = {'high': 0, 'medium': 1, 'low': 2}
+
+# Task runtime status tracking, loaded from and saved to the status file
 task_status = {}
 
 # Circuit breaker pattern implementation
@@ -140,42 +164,55 @@ class CircuitBreaker:
     - CLOSED: Normal operation, requests pass through
     - OPEN: Failure threshold reached, requests immediately fail
     - HALF-OPEN: After timeout period, allows one test request
+    
+    Each failed test request multiplies the reset timeout by backoff_factor,
+    up to max_reset_timeout; a success restores the original timeout.
     """
     CLOSED = 'CLOSED'
     OPEN = 'OPEN'
     HALF_OPEN = 'HALF_OPEN'
     
-    def __init__(self, name, failure_threshold=3, reset_timeout=300):
+    def __init__(self, name, failure_threshold=3, reset_timeout=300, backoff_factor=2, max_reset_timeout=3600):
         self.name = name
         self.state = self.CLOSED
         self.failure_count = 0
         self.failure_threshold = failure_threshold
         self.reset_timeout = reset_timeout  # seconds
+        self.initial_reset_timeout = reset_timeout
+        self.backoff_factor = backoff_factor
+        self.max_reset_timeout = max_reset_timeout
         self.last_failure_time = None
         self.last_success_time = None
-        debug_logger.debug(f"Circuit breaker '{name}' initialized in {self.state} state")
+        debug_logger.debug("Circuit breaker '%s' initialized in %s state", name, self.state)
         
     def record_failure(self):
         """Record a failure and potentially open the circuit"""
         self.failure_count += 1
         self.last_failure_time = datetime.now()
         
-        if self.state == self.CLOSED and self.failure_count >= self.failure_threshold:
+        if self.state == self.HALF_OPEN:
+            # The test request failed, so wait longer before the next one
+            self.reset_timeout = min(self.reset_timeout * self.backoff_factor, self.max_reset_timeout)
+            self.state = self.OPEN
+            logger.warning(f"Circuit '{self.name}' re-OPENED after failed test, "
+                           f"next test in {self.reset_timeout} seconds")
+        elif self.state == self.CLOSED and self.failure_count >= self.failure_threshold:
             self.state = self.OPEN
             logger.warning(f"Circuit '{self.name}' OPENED after {self.failure_count} failures")
         
-        debug_logger.debug(f"Circuit '{self.name}' failure recorded. State: {self.state}, Count: {self.failure_count}")
+        debug_logger.debug("Circuit '%s' failure recorded. State: %s, Count: %s", self.name, self.state, self.failure_count)
     
     def record_success(self):
         """Record a success and reset failure count"""
         self.failure_count = 0
         self.last_success_time = datetime.now()
+        self.reset_timeout = self.initial_reset_timeout
         
         if self.state == self.HALF_OPEN:
             self.state = self.CLOSED
             logger.info(f"Circuit '{self.name}' CLOSED after successful test")
         
-        debug_logger.debug(f"Circuit '{self.name}' success recorded. State: {self.state}")
+        debug_logger.debug("Circuit '%s' success recorded. State: %s", self.name, self.state)
     
     def can_execute(self):
         """Check if the operation can be executed based on circuit state"""
@@ -192,14 +229,29 @@ class CircuitBreaker:
             
         # In HALF-OPEN state, we allow exactly one test request
         return True
+    
+    def time_to_retry(self):
+        """Seconds until an OPEN circuit allows a test request"""
+        if self.state != self.OPEN or self.last_failure_time is None:
+            return 0
+        
+        elapsed = (datetime.now() - self.last_failure_time).total_seconds()
+        return max(0, self.reset_timeout - elapsed)
 
     def __str__(self):
         return f"CircuitBreaker(name='{self.name}', state={self.state}, failures={self.failure_count})"
 
 # Resource monitoring functions
-def get_system_resources():
-    """Get current system resource usage"""
-    cpu_percent = psutil.cpu_percent(interval=0.1)
+RESOURCE_SAMPLE_INTERVAL = 2  # seconds
+
+# Latest resource sample, refreshed by a background thread (see get_system_resources)
+_last_resources = None
+_resource_sampler = None
+_resource_sampler_lock = threading.Lock()
+
+def sample_system_resources(cpu_interval=None):
+    """Sample current system resource usage"""
+    cpu_percent = psutil.cpu_percent(interval=cpu_interval)
     memory = psutil.virtual_memory()
     disk = psutil.disk_usage('/')
     
@@ -210,6 +262,37 @@ def get_system_resources():
         'timestamp': datetime.now().isoformat()
     }
 
+def run_resource_sampler():
+    """Refresh the resource sample every RESOURCE_SAMPLE_INTERVAL seconds until shutdown"""
+    global _last_resources
+    
+    while not shutdown_event.wait(RESOURCE_SAMPLE_INTERVAL):
+        try:
+            _last_resources = sample_system_resources()
+        except Exception as e:
+            logger.error(f"Error sampling system resources: {e}")
+
+def get_system_resources():
+    """
+    Get system resource usage from the latest background sample.
+    
+    The first call takes a blocking sample and starts the sampler thread;
+    later calls return immediately. CPU usage is measured over the time since
+    the previous sample, so the sampler never has to sleep inside psutil.
+    """
+    global _last_resources, _resource_sampler
+    
+    if _resource_sampler is None:
+        with _resource_sampler_lock:
+            if _resource_sampler is None:
+                _last_resources = sample_system_resources(cpu_interval=0.1)
+                _resource_sampler = threading.Thread(
+                    target=run_resource_sampler, name="resource-sampler", daemon=True
+                )
+                _resource_sampler.start()
+    
+    return dict(_last_resources)
+
 def is_system_under_stress():
     """Determine if the system is under high resource usage"""
     resources = get_system_resources()
@@ -235,9 +318,9 @@ def track_execution_time(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
         task_name = kwargs.get('task', {}).get('name', 'unknown')
-        start_time = time.time()
+        start_time = time.monotonic()
         result = func(*args, **kwargs)
-        execution_time = time.time() - start_time
+        execution_time = time.monotonic() - start_time
         
         if task_name not in task_status:
             task_status[task_name] = {}
@@ -249,28 +332,251 @@ def track_execution_time(func):
         return result
     return wrapper
 
-# Context manager for timeout handling
-@contextmanager
-def task_timeout(seconds, task_name):
-    """Context manager to add timeout to a task"""
-    def timeout_handler(signum, frame):
-        raise TimeoutError(f"Task '{task_name}' timed out after {seconds} seconds")
+class TaskRunner:
+    """
+    Runs tasks on a fixed pool of worker threads, highest priority first.
     
-    original_handler = signal.getsignal(signal.SIGALRM)
-    try:
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(seconds)
-        yield
-    finally:
-        signal.alarm(0)
-        signal.signal(signal.SIGALRM, original_handler)
+    Tasks of equal priority run in the order they were submitted. A task
+    is not queued again while a previous run of it is still queued or
+    running.
+    """
+    
+    def __init__(self, max_workers):
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._workers = []
+        self._active = set()  # names of tasks queued or running
+        self._active_lock = threading.Lock()
+        
+        for i in range(max(1, max_workers)):
+            worker = threading.Thread(target=self._run, name=f"task-runner-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+        
+        debug_logger.debug("Task runner started with %d workers", len(self._workers))
+    
+    def submit(self, task):
+        """Queue a task to run on the next free worker, returning False if it is already queued or running"""
+        task_name = task.get('name')
+        with self._active_lock:
+            if task_name in self._active:
+                logger.warning(f"Task '{task_name}' is still queued or running, skipping this run")
+                return False
+            self._active.add(task_name)
+        
+        priority = TASK_PRIORITIES.get(task.get('priority', 'medium'), TASK_PRIORITIES['medium'])
+        self._queue.put((priority, next(self._sequence), task))
+        return True
+    
+    def shutdown(self):
+        """Drop queued tasks and stop the workers once their current task finishes"""
+        try:
+            while True:
+                _, _, task = self._queue.get_nowait()
+                if task is not None:
+                    self._finished(task)
+        except queue.Empty:
+            pass
+        
+        # None sorts after every queued task, so workers stop once the queue is empty
+        for _ in self._workers:
+            self._queue.put((len(TASK_PRIORITIES), next(self._sequence), None))
+    
+    def _run(self):
+        while True:
+            _, _, task = self._queue.get()
+            if task is None:
+                return
+            
+            try:
+                execute_task(task=task)
+            except Exception as e:
+                logger.error(f"Unhandled error running task '{task.get('name')}': {e}", exc_info=True)
+            finally:
+                self._finished(task)
+    
+    def _finished(self, task):
+        with self._active_lock:
+            self._active.discard(task.get('name'))
+
+class MiniScheduler:
+    """
+    Runs jobs at their scheduled times, keeping them in a heap ordered by next run.
+    
+    Each job has a next_run function that, given a datetime, returns the
+    datetime of the job's next run after it. One-off jobs can also be added
+    from any thread with call_at.
+    """
+    
+    def __init__(self):
+        # heap of (next run, sequence, next_run function, job function, one-off key);
+        # one-off jobs have no next_run function
+        self._jobs = []
+        self._once_keys = set()
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+    
+    def add(self, next_run, job):
+        """Schedule a job, first running at next_run(now)"""
+        with self._lock:
+            heapq.heappush(self._jobs, (next_run(datetime.now()), next(self._sequence), next_run, job, None))
+    
+    def call_at(self, when, job, key):
+        """Run a job once at the given time, returning False if a job with the same key is already waiting"""
+        with self._lock:
+            if key in self._once_keys:
+                return False
+            self._once_keys.add(key)
+            heapq.heappush(self._jobs, (when, next(self._sequence), None, job, key))
+        return True
+    
+    def clear(self):
+        """Remove all jobs"""
+        with self._lock:
+            self._jobs.clear()
+            self._once_keys.clear()
+    
+    def run_pending(self):
+        """Run every job that is due, then schedule its next run"""
+        now = datetime.now()
+        
+        while True:
+            with self._lock:
+                if not self._jobs or self._jobs[0][0] > now:
+                    return
+                _, sequence, next_run, job, key = heapq.heappop(self._jobs)
+                if next_run is None:
+                    self._once_keys.discard(key)
+            
+            try:
+                job()
+            except Exception as e:
+                logger.error(f"Error running scheduled job: {e}", exc_info=True)
+            
+            if next_run is not None:
+                with self._lock:
+                    heapq.heappush(self._jobs, (next_run(now), sequence, next_run, job, None))
+    
+    def idle_seconds(self):
+        """Seconds until the next job is due, or None if there are no jobs"""
+        with self._lock:
+            if not self._jobs:
+                return None
+            return (self._jobs[0][0] - datetime.now()).total_seconds()
+
+# Scheduled jobs for all tasks (filled in by schedule_tasks)
+scheduler = MiniScheduler()
 
 # Initialize circuit breakers for tasks
 circuit_breakers = {}
 
+def build_task_argv(task, python_executable=sys.executable):
+    """
+    Build the argument list used to run a task.
+    
+    Tasks either give a command line in 'command', or a Python 'script'
+    with optional 'args' to run with the configured interpreter.
+    
+    Args:
+        task (dict): Task configuration
+        python_executable (str): Interpreter used to run 'script' tasks
+    
+    Returns:
+        list: The command arguments, or None if the task has nothing to run
+    """
+    command = task.get('command')
+    if command:
+        return shlex.split(command)
+    
+    script = task.get('script')
+    if script:
+        return [python_executable, script, *task.get('args', [])]
+    
+    return None
+
+def resolve_config(cfg):
+    """
+    Resolve the settings used on every task run and notification.
+    
+    Args:
+        cfg (dict): Scheduler configuration
+    
+    Returns:
+        SimpleNamespace: The resolved settings
+    """
+    general = cfg.get('general', {})
+    notification = cfg.get('notification', {})
+    
+    return SimpleNamespace(
+        status_file=general.get('status_file', 'data/scheduler_status.json'),
+        python_executable=general.get('python_executable', sys.executable),
+        max_concurrent_tasks=general.get('max_concurrent_tasks', 2),
+        metrics_host=general.get('metrics_host', '127.0.0.1'),
+        metrics_port=general.get('metrics_port'),
+        email=notification.get('email', {}),
+        webhook=notification.get('webhook', {}),
+        tasks_by_name={task.get('name'): task for task in cfg.get('tasks', [])}
+    )
+
+# Settings resolved from the current configuration (updated by load_config)
+settings = resolve_config(config)
+
+def parse_schedule(task_schedule):
+    """
+    Parse a task schedule into a (kind, value) record.
+    
+    Supports 'hourly', 'daily', 'weekly' and cron expressions whose minute
+    field is either '*/n' (every n minutes) or a number (that minute of each
+    hour); the other cron fields are ignored.
+    
+    Args:
+        task_schedule (str): Schedule from the task configuration
+    
+    Returns:
+        tuple: The schedule kind and its value (None if it takes no value)
+    
+    Raises:
+        ValueError: If the schedule is not supported
+    """
+    if task_schedule in ('hourly', 'daily', 'weekly'):
+        return task_schedule, None
+    
+    parts = task_schedule.split()
+    if len(parts) != 5:
+        raise ValueError(f"Invalid cron expression: {task_schedule}")
+    
+    minute = parts[0]
+    if minute.startswith('*/'):
+        interval = int(minute[2:])
+        if interval < 1:
+            raise ValueError(f"Invalid minute interval in cron expression: {task_schedule}")
+        return 'every_minutes', interval
+    
+    if minute.isdigit() and int(minute) < 60:
+        return 'hour_at', int(minute)
+    
+    raise ValueError(f"Unsupported cron expression: {task_schedule}")
+
+def compile_task_schedule(task):
+    """
+    Parse a task's schedule, defaulting to hourly if it is not supported.
+    
+    Args:
+        task (dict): Task configuration
+    
+    Returns:
+        tuple: The schedule kind and value (see parse_schedule)
+    """
+    try:
+        return parse_schedule(task.get('schedule', 'daily'))
+    except ValueError as e:
+        logger.warning(f"{e} for task {task.get('name')}")
+        logger.warning(f"Defaulting to hourly schedule for task {task.get('name')}")
+        return 'hourly', None
+
 def load_config(config_path=None):
     """Load configuration from file or use defaults."""
-    global config
+    global config, settings
     
     if config_path and os.path.exists(config_path):
         try:
@@ -286,49 +592,162 @@ def load_config(config_path=None):
         logger.info("No configuration file found, using default configuration")
         config = DEFAULT_CONFIG
     
-    # Ensure the status file directory exists
-    status_file = config.get('general', {}).get('status_file', 'data/scheduler_status.json')
-    os.makedirs(os.path.dirname(status_file), exist_ok=True)
+    settings = resolve_config(config)
+    
+    # Ensure the status file directory exists, so saves never need to check
+    status_dir = os.path.dirname(settings.status_file)
+    if status_dir:
+        os.makedirs(status_dir, exist_ok=True)
+    
+    # Split each task's command line and parse its schedule once, instead of on every run
+    for task in config.get('tasks', []):
+        task['_argv'] = build_task_argv(task, settings.python_executable)
+        task['_schedule'] = compile_task_schedule(task)
     
     return config
 
+# Serialized task statuses from the last save, used to skip unchanged writes
+_last_saved_statuses = None
+_status_file_lock = threading.Lock()
+
+def dump_status_json(value):
+    """Serialize a status value to compact JSON bytes with sorted keys, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=str, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+
+def load_status_json(data):
+    """Parse JSON bytes from the status file, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def save_task_status():
-    """Save task status to file."""
-    status_file = config.get('general', {}).get('status_file', 'data/scheduler_status.json')
+    """
+    Save task status to file.
+    
+    The file is replaced atomically, and is not rewritten when the task
+    statuses have not changed since the last save.
+    """
+    global _last_saved_statuses
     
     try:
-        with open(status_file, 'w') as f:
-            status_data = {
-                "last_updated": datetime.now().isoformat(),
-                "tasks": task_statuses
-            }
-            json.dump(status_data, f, indent=2)
+        with _status_file_lock:
+            # Copy the statuses first, as running tasks keep updating them
+            statuses = {name: dict(status) for name, status in list(task_status.items())}
+            tasks_json = dump_status_json(statuses)
+            if tasks_json == _last_saved_statuses:
+                return
+            
+            last_updated = datetime.now().isoformat().encode('ascii')
+            temp_file = settings.status_file + '.tmp'
+            with open(temp_file, 'wb') as f:
+                f.write(b'{"last_updated":"' + last_updated + b'","tasks":' + tasks_json + b'}')
+            os.replace(temp_file, settings.status_file)
+            
+            _last_saved_statuses = tasks_json
     except Exception as e:
         logger.error(f"Error saving task status: {e}")
 
 def load_task_status():
     """Load task status from file."""
-    global task_statuses
+    task_status.clear()
+    
+    try:
+        with open(settings.status_file, 'rb') as f:
+            data = load_status_json(f.read())
+            task_status.update(data.get('tasks', {}))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error(f"Error loading task status: {e}")
+
+def create_webhook_session():
+    """
+    Create the HTTP session used for webhook notifications.
+    
+    The session keeps connections to the webhook host open between
+    notifications, and retries requests rejected by an overloaded gateway.
+    
+    Returns:
+        requests.Session: The configured session
+    """
+    retry = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset(['POST'])
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Session shared by all webhook notifications
+webhook_session = create_webhook_session()
+
+# Notifications waiting to be sent by the notification thread
+NOTIFICATION_QUEUE_SIZE = 256
+notification_queue = queue.Queue(maxsize=NOTIFICATION_QUEUE_SIZE)
+_notification_worker = None
+_notification_worker_lock = threading.Lock()
+
+def send_notification(task_name, status, message):
+    """
+    Queue a notification to be sent via email and/or webhook.
     
-    status_file = config.get('general', {}).get('status_file', 'data/scheduler_status.json')
+    Notifications are sent by a background thread, so a slow or unreachable
+    mail server or webhook does not hold up the task that failed. If the
+    queue is full, the notification is dropped.
+    """
+    global _notification_worker
     
-    if os.path.exists(status_file):
+    if _notification_worker is None:
+        with _notification_worker_lock:
+            if _notification_worker is None:
+                _notification_worker = threading.Thread(
+                    target=run_notification_worker, name="notifications", daemon=True
+                )
+                _notification_worker.start()
+    
+    try:
+        notification_queue.put_nowait((task_name, status, message, datetime.now().isoformat()))
+    except queue.Full:
+        logger.error(f"Notification queue full, dropping notification for task {task_name}")
+
+def run_notification_worker():
+    """Send queued notifications until stopped by stop_notification_worker"""
+    while True:
+        notification = notification_queue.get()
+        if notification is None:
+            return
+        
         try:
-            with open(status_file, 'r') as f:
-                data = json.load(f)
-                task_statuses = data.get('tasks', {})
+            deliver_notification(*notification)
         except Exception as e:
-            logger.error(f"Error loading task status: {e}")
-            task_statuses = {}
-    else:
-        task_statuses = {}
+            logger.error(f"Error sending notification: {e}")
 
-def send_notification(task_name, status, message):
-    """Send notification via email and/or webhook."""
-    notification_config = config.get('notification', {})
+def stop_notification_worker(timeout=10):
+    """Send the queued notifications, waiting up to timeout seconds, and stop the notification thread"""
+    global _notification_worker
     
+    with _notification_worker_lock:
+        if _notification_worker is None:
+            return
+        
+        try:
+            notification_queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("Notification queue still full, some notifications may not be sent")
+        _notification_worker.join(timeout)
+        _notification_worker = None
+
+def deliver_notification(task_name, status, message, timestamp):
+    """Send notification via email and/or webhook."""
     # Email notification
-    email_config = notification_config.get('email', {})
+    email_config = settings.email
     if email_config.get('enabled', False):
         try:
             smtp_server = email_config.get('smtp_server')
@@ -352,7 +771,7 @@ def send_notification(task_name, status, message):
             body = f"""
             Task: {task_name}
             Status: {status}
-            Time: {datetime.now().isoformat()}
+            Time: {timestamp}
             
             Message:
             {message}
@@ -372,7 +791,7 @@ def send_notification(task_name, status, message):
             logger.error(f"Error sending email notification: {e}")
     
     # Webhook notification
-    webhook_config = notification_config.get('webhook', {})
+    webhook_config = settings.webhook
     if webhook_config.get('enabled', False):
         try:
             url = webhook_config.get('url')
@@ -386,12 +805,12 @@ def send_notification(task_name, status, message):
             payload = {
                 "task_name": task_name,
                 "status": status,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "message": message
             }
             
             # Send webhook
-            response = requests.post(url, headers=headers, json=payload, timeout=10)
+            response = webhook_session.post(url, headers=headers, json=payload, timeout=10)
             response.raise_for_status()
             
             logger.info(f"Sent webhook notification for task {task_name}")
@@ -399,6 +818,15 @@ def send_notification(task_name, status, message):
         except Exception as e:
             logger.error(f"Error sending webhook notification: {e}")
 
+# Number of trailing output lines kept from each task run
+TASK_OUTPUT_LINES = 200
+
+def drain_stream(stream, lines):
+    """Read a process output stream to the end, keeping its lines in a bounded deque"""
+    with stream:
+        for line in stream:
+            lines.append(line.rstrip('\n'))
+
 @track_execution_time
 def execute_task(task):
     """
@@ -411,11 +839,11 @@ def execute_task(task):
         bool: True if successful, False otherwise
     """
     task_name = task.get('name', 'Unknown Task')
-    command = task.get('command')
+    argv = task['_argv'] if '_argv' in task else build_task_argv(task)
     timeout = task.get('timeout', 300)  # Default timeout: 5 minutes
     priority = task.get('priority', 'medium')
     
-    if not command:
+    if not argv:
         logger.error(f"No command specified for task '{task_name}'")
         return False
     
@@ -423,11 +851,25 @@ def execute_task(task):
     if task_name not in circuit_breakers:
         failure_threshold = task.get('failure_threshold', 3)
         reset_timeout = task.get('reset_timeout', 300)
-        circuit_breakers[task_name] = CircuitBreaker(task_name, failure_threshold, reset_timeout)
+        circuit_breakers[task_name] = CircuitBreaker(
+            task_name,
+            failure_threshold,
+            reset_timeout,
+            backoff_factor=task.get('reset_backoff_factor', 2),
+            max_reset_timeout=task.get('max_reset_timeout', 3600)
+        )
     
-    # Check circuit breaker state
-    if not circuit_breakers[task_name].can_execute():
-        logger.warning(f"Circuit breaker for '{task_name}' is OPEN, skipping execution")
+    # Check circuit breaker state. Rather than hold a worker while the circuit
+    # is OPEN, run the task again once the circuit allows a test request.
+    breaker = circuit_breakers[task_name]
+    if not breaker.can_execute():
+        retry_at = datetime.now() + timedelta(seconds=breaker.time_to_retry())
+        if (task_runner is not None and not shutdown_event.is_set()
+                and scheduler.call_at(retry_at, partial(task_runner.submit, task), key=('circuit_test', task_name))):
+            logger.warning(f"Circuit breaker for '{task_name}' is OPEN, skipping execution until a test "
+                           f"run at {retry_at:%H:%M:%S}")
+        else:
+            logger.warning(f"Circuit breaker for '{task_name}' is OPEN, skipping execution")
         return False
     
     # Check system resources if not a high priority task
@@ -447,20 +889,28 @@ def execute_task(task):
     task_status[task_name]['state'] = 'running'
     
     # Execute task in a subprocess
-    env = os.environ.copy()
+    # Tasks inherit the scheduler's environment (env=None) unless they add variables
+    task_env = task.get('env')
+    env = {**os.environ, **task_env} if task_env else None
     max_retries = task.get('max_retries', 3)
     retry_delay = task.get('retry_delay', 5)
+    retry_max_delay = task.get('retry_max_delay', 300)
     
     success = False
     error_message = None
     attempt = 0
-    start_time = time.time()
+    start_time = time.monotonic()
     
     while attempt < max_retries and not success and not shutdown_event.is_set():
         if attempt > 0:
-            retry_sleep = retry_delay * (2 ** (attempt - 1))  # Exponential backoff
-            logger.info(f"Retry attempt {attempt} for task '{task_name}', waiting {retry_sleep} seconds...")
-            time.sleep(retry_sleep)
+            # Exponential backoff with full jitter, so tasks sharing a failing
+            # dependency do not all retry at the same moment
+            backoff = min(retry_max_delay, retry_delay * (2 ** (attempt - 1)))
+            retry_sleep = random.uniform(0, backoff)
+            logger.info(f"Retry attempt {attempt} for task '{task_name}', waiting {retry_sleep:.1f} seconds...")
+            if shutdown_event.wait(retry_sleep):
+                # Shutting down; don't start another attempt
+                break
         
         attempt += 1
         task_status[task_name]['current_attempt'] = attempt
@@ -470,42 +920,70 @@ def execute_task(task):
             pre_resources = get_system_resources()
             task_status[task_name]['pre_resources'] = pre_resources
             
-            # Add a timeout to prevent tasks from hanging
-            with task_timeout(timeout, task_name):
-                logger.info(f"Running command: {command}")
-                process = subprocess.Popen(
-                    command,
-                    shell=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    env=env,
-                    text=True
-                )
-                
-                stdout, stderr = process.communicate()
-                exit_code = process.returncode
-                
-                # Take snapshot after task execution
-                post_resources = get_system_resources()
-                task_status[task_name]['post_resources'] = post_resources
-                
-                # Calculate resource usage deltas
-                cpu_delta = post_resources['cpu_percent'] - pre_resources['cpu_percent']
-                memory_delta = post_resources['memory_percent'] - pre_resources['memory_percent']
-                
+            logger.info(f"Running command: {shlex.join(argv)}")
+            process = subprocess.Popen(
+                argv,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=env,
+                text=True,
+                errors='replace',
+                bufsize=1
+            )
+            # Key by run as well as name, so overlapping runs of a task never
+            # replace or remove each other's entry
+            process_key = (task_name, process.pid)
+            running_processes[process_key] = process
+            
+            # Keep only the last lines of output, however much the task writes
+            stdout_lines = deque(maxlen=TASK_OUTPUT_LINES)
+            stderr_lines = deque(maxlen=TASK_OUTPUT_LINES)
+            readers = [
+                threading.Thread(target=drain_stream, args=(process.stdout, stdout_lines), daemon=True),
+                threading.Thread(target=drain_stream, args=(process.stderr, stderr_lines), daemon=True)
+            ]
+            for reader in readers:
+                reader.start()
+            
+            # Add a timeout to prevent tasks from hanging. Tasks run on worker
+            # threads, so this cannot rely on SIGALRM.
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise TimeoutError(f"Task '{task_name}' timed out after {timeout} seconds")
+            finally:
+                for reader in readers:
+                    reader.join()
+                running_processes.pop(process_key, None)
+            exit_code = process.returncode
+            stdout = '\n'.join(stdout_lines)
+            stderr = '\n'.join(stderr_lines)
+            
+            # Take snapshot after task execution
+            post_resources = get_system_resources()
+            task_status[task_name]['post_resources'] = post_resources
+            
+            # Calculate resource usage deltas
+            cpu_delta = post_resources['cpu_percent'] - pre_resources['cpu_percent']
+            memory_delta = post_resources['memory_percent'] - pre_resources['memory_percent']
+            
+            # Task output can be large, so only log it when debug logging is on
+            if debug_logger.isEnabledFor(logging.DEBUG):
                 if stdout:
-                    debug_logger.debug(f"Task '{task_name}' stdout: {stdout}")
+                    debug_logger.debug("Task '%s' stdout: %s", task_name, stdout)
                 
                 if stderr:
-                    debug_logger.debug(f"Task '{task_name}' stderr: {stderr}")
-                
-                if exit_code == 0:
-                    success = True
-                    logger.info(f"Task '{task_name}' completed successfully (CPU delta: {cpu_delta:.1f}%, "
-                                f"Memory delta: {memory_delta:.1f}%)")
-                else:
-                    error_message = f"Command exited with code {exit_code}: {stderr}"
-                    logger.error(f"Task '{task_name}' failed: {error_message}")
+                    debug_logger.debug("Task '%s' stderr: %s", task_name, stderr)
+            
+            if exit_code == 0:
+                success = True
+                logger.info(f"Task '{task_name}' completed successfully (CPU delta: {cpu_delta:.1f}%, "
+                            f"Memory delta: {memory_delta:.1f}%)")
+            else:
+                error_message = f"Command exited with code {exit_code}: {stderr}"
+                logger.error(f"Task '{task_name}' failed: {error_message}")
                     
         except TimeoutError as e:
             error_message = str(e)
@@ -516,7 +994,7 @@ def execute_task(task):
     
     # Update task status
     task_status[task_name]['success'] = success
-    task_status[task_name]['last_run_duration'] = time.time() - start_time
+    task_status[task_name]['last_run_duration'] = time.monotonic() - start_time
     task_status[task_name]['state'] = 'completed'
     
     if success:
@@ -543,72 +1021,113 @@ def execute_task(task):
     
     return success
 
+def next_hour_at(minute, after):
+    """Get the first time after the given time that is at the given minute of an hour"""
+    next_run = after.replace(minute=minute, second=0, microsecond=0)
+    if next_run <= after:
+        next_run += timedelta(hours=1)
+    return next_run
+
+# Next run time after a given time, for each compiled schedule kind (see parse_schedule)
+SCHEDULE_NEXT_RUN = {
+    'hourly': lambda value, after: after + timedelta(hours=1),
+    'daily': lambda value, after: (after + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0),
+    'weekly': lambda value, after: (after + timedelta(days=7 - after.weekday())).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    ),
+    'every_minutes': lambda value, after: after + timedelta(minutes=value),
+    'hour_at': next_hour_at
+}
+
+SCHEDULE_DESCRIPTIONS = {
+    'hourly': "hourly",
+    'daily': "daily at midnight",
+    'weekly': "weekly on Monday at midnight",
+    'every_minutes': "every {} minutes",
+    'hour_at': "at minute {} of each hour"
+}
+
 def schedule_tasks():
     """Schedule all enabled tasks according to their configuration."""
+    global task_runner
+    
     tasks = config.get('tasks', [])
     
+    # Scheduled jobs only queue their task, so the scheduler loop never waits on one
+    if task_runner is None:
+        task_runner = TaskRunner(settings.max_concurrent_tasks)
+    
     # Clear existing schedule
-    schedule.clear()
+    scheduler.clear()
     
     for task in tasks:
         if not task.get('enabled', True):
             logger.info(f"Task {task.get('name')} is disabled, skipping")
             continue
         
-        task_schedule = task.get('schedule', 'daily')
-        
-        if task_schedule == 'hourly':
-            schedule.every().hour.do(execute_task, task)
-            logger.info(f"Scheduled task {task.get('name')} to run hourly")
-        
-        elif task_schedule == 'daily':
-            schedule.every().day.at("00:00").do(execute_task, task)
-            logger.info(f"Scheduled task {task.get('name')} to run daily at midnight")
-        
-        elif task_schedule == 'weekly':
-            schedule.every().monday.at("00:00").do(execute_task, task)
-            logger.info(f"Scheduled task {task.get('name')} to run weekly on Monday at midnight")
-        
+        kind, value = task['_schedule'] if '_schedule' in task else compile_task_schedule(task)
+        scheduler.add(partial(SCHEDULE_NEXT_RUN[kind], value), partial(task_runner.submit, task))
+        logger.info(f"Scheduled task {task.get('name')} to run {SCHEDULE_DESCRIPTIONS[kind].format(value)}")
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """
+    Serves the latest resource sample at /metrics, and task and circuit
+    breaker state at /health, as JSON.
+    
+    Both are built from state the scheduler already keeps, so requests never
+    sample system resources themselves.
+    """
+    
+    def do_GET(self):
+        if self.path == '/metrics':
+            body = get_system_resources()
+        elif self.path == '/health':
+            body = {
+                'tasks': {name: dict(status) for name, status in list(task_status.items())},
+                'circuit_breakers': {name: str(breaker) for name, breaker in list(circuit_breakers.items())}
+            }
         else:
-            # Assume it's a cron-like expression
-            try:
-                # Parse the cron expression
-                parts = task_schedule.split()
-                
-                if len(parts) == 5:
-                    minute, hour, day, month, day_of_week = parts
-                    
-                    # Handle */n syntax for minutes
-                    if minute.startswith('*/'):
-                        interval = int(minute.split('/')[1])
-                        schedule.every(interval).minutes.do(execute_task, task)
-                        logger.info(f"Scheduled task {task.get('name')} to run every {interval} minutes")
-                    else:
-                        # For simplicity, just run at the specified minute of each hour
-                        if minute.isdigit():
-                            schedule.every().hour.at(f":{minute}").do(execute_task, task)
-                            logger.info(f"Scheduled task {task.get('name')} to run at minute {minute} of each hour")
-                        else:
-                            logger.warning(f"Unsupported cron expression for task {task.get('name')}: {task_schedule}")
-                            logger.warning(f"Defaulting to hourly schedule for task {task.get('name')}")
-                            schedule.every().hour.do(execute_task, task)
-                else:
-                    logger.warning(f"Invalid cron expression for task {task.get('name')}: {task_schedule}")
-                    logger.warning(f"Defaulting to hourly schedule for task {task.get('name')}")
-                    schedule.every().hour.do(execute_task, task)
-            
-            except Exception as e:
-                logger.error(f"Error parsing schedule for task {task.get('name')}: {e}")
-                logger.warning(f"Defaulting to hourly schedule for task {task.get('name')}")
-                schedule.every().hour.do(execute_task, task)
+            self.send_error(404)
+            return
+        
+        data = json.dumps(body, default=str).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format, *args):
+        debug_logger.debug("Metrics request from %s: " + format, self.client_address[0], *args)
+
+def start_metrics_server(host, port):
+    """
+    Start serving /metrics and /health on a background thread.
+    
+    Args:
+        host (str): Address to listen on
+        port (int): Port to listen on
+    
+    Returns:
+        ThreadingHTTPServer: The running server
+    """
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logger.info(f"Serving metrics on http://{host}:{server.server_port}/metrics")
+    return server
 
 def handle_shutdown(signum, frame):
     """Handle shutdown signal gracefully."""
     logger.info("Shutdown signal received, stopping scheduler...")
     shutdown_event.set()
     
+    # Drop tasks that have not started yet
+    if task_runner is not None:
+        task_runner.shutdown()
+    
     # Terminate all running processes
-    for task_name, process in list(running_processes.items()):
+    for (task_name, _), process in list(running_processes.items()):
         if process.poll() is None:
             logger.info(f"Terminating running task: {task_name}")
             process.terminate()
@@ -621,11 +1140,19 @@ def handle_shutdown(signum, frame):
     # Save final task status
     save_task_status()
     
+    stop_notification_worker()
+    webhook_session.close()
+    
+    if metrics_server is not None:
+        metrics_server.shutdown()
+    
     logger.info("Scheduler stopped")
     sys.exit(0)
 
 def main():
     """Main entry point."""
+    global metrics_server
+    
     parser = argparse.ArgumentParser(description="Scheduler for security monitoring tasks")
     parser.add_argument("--config", "-c", help="Path to configuration file")
     parser.add_argument("--run-now", "-r", help="Run a specific task immediately")
@@ -645,31 +1172,41 @@ def main():
     # Handle special commands
     if args.run_now:
         task_name = args.run_now
-        task = next((t for t in config.get('tasks', []) if t.get('name') == task_name), None)
+        task = settings.tasks_by_name.get(task_name)
         
         if task:
             logger.info(f"Running task {task_name} immediately")
             execute_task(task)
+            stop_notification_worker()
         else:
             logger.error(f"Task {task_name} not found in configuration")
         
         return
     
     if args.status:
-        print(json.dumps(task_statuses, indent=2))
+        print(json.dumps(task_status, indent=2))
         return
     
     # Schedule tasks
     schedule_tasks()
     
+    if settings.metrics_port is not None:
+        metrics_server = start_metrics_server(settings.metrics_host, settings.metrics_port)
+    
     # Run immediately if requested
     
     # Run the scheduler
     logger.info("Starting scheduler")
     
+    # Sleep until the next job is due (at most a minute), waking early on shutdown
     while not shutdown_event.is_set():
-        schedule.run_pending()
-        time.sleep(1)
+        scheduler.run_pending()
+        
+        idle = scheduler.idle_seconds()
+        if idle is None:
+            idle = 60
+        if idle > 0:
+            shutdown_event.wait(min(idle, 60))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -8,13 +8,35 @@ import os
 import sys
 import json
 import argparse
+import functools
 import logging
 import platform
+import shlex
+import signal
 import subprocess
 import shutil
+import threading
+import importlib
+import importlib.metadata
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from types import MappingProxyType, ModuleType
+from typing import BinaryIO, Dict, List, Any, Mapping, Optional, Tuple, Union
+
+# orjson is optional and only used to read and write configuration faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# packaging is optional and only used to check whether requirements are met
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+    PACKAGING_AVAILABLE = True
+except ImportError:
+    PACKAGING_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -38,14 +60,130 @@ DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
 # Configuration directory
 CONFIG_DIR = os.path.join(PROJECT_ROOT, 'config')
 
+# Make project modules, such as the security module, importable
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+# Python requirements file
+REQUIREMENTS_TXT = os.path.join(PROJECT_ROOT, 'requirements.txt')
+# Node.js package file
+PACKAGE_JSON = os.path.join(PROJECT_ROOT, 'package.json')
+
 # Ensure directories exist
 os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(CONFIG_DIR, exist_ok=True)
 
+# Configuration written when a configuration file does not exist yet
+DEFAULT_CONFIG: Dict[str, Any] = {
+    'platform_specific': {
+        'windows': {
+            'commands': {
+                'setup': 'setup.bat',
+                'update': 'update.bat',
+                'run': 'run.bat'
+            },
+            'paths': {
+                'python': 'python',
+                'npm': 'npm'
+            }
+        },
+        'linux': {
+            'commands': {
+                'setup': './setup.sh',
+                'update': './update.sh',
+                'run': './run.sh'
+            },
+            'paths': {
+                'python': 'python3',
+                'npm': 'npm'
+            }
+        },
+        'darwin': {
+            'commands': {
+                'setup': './setup.sh',
+                'update': './update.sh',
+                'run': './run.sh'
+            },
+            'paths': {
+                'python': 'python3',
+                'npm': 'npm'
+            }
+        }
+    },
+    'common': {
+        'environment': {
+            'DEBUG': 'false',
+            'LOG_LEVEL': 'info'
+        },
+        'paths': {
+            'data': 'data',
+            'logs': 'logs'
+        }
+    }
+}
+
+# Parsed configuration files, keyed by path, with the file's mtime when read
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# Merged platform configuration, with the configuration it was built from
+_PLATFORM_CONFIG_CACHE: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+
+# Command environment, with the platform configuration it was built from
+_ENVIRONMENT_CACHE: Optional[Tuple[Dict[str, Any], Mapping[str, str]]] = None
+
+@functools.lru_cache(maxsize=None)
+def _exists(path: str) -> bool:
+    """
+    Check whether a project file exists.
+    
+    The result is cached, as the project files checked this way do not
+    appear or disappear while the script runs.
+    
+    Args:
+        path: Path to check
+        
+    Returns:
+        True if the path exists
+    """
+    return os.path.exists(path)
+
+@functools.lru_cache(maxsize=None)
+def _load_security_module() -> Optional[ModuleType]:
+    """
+    Import the project's security module.
+    
+    Returns:
+        The security module, or None if the project does not have one
+    """
+    if importlib.util.find_spec('security') is None:
+        return None
+    
+    return importlib.import_module('security')
+
+def _write_default_config(config_path: str) -> None:
+    """
+    Write the default configuration to a file.
+    
+    Args:
+        config_path: Path of the configuration file to create
+    """
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(DEFAULT_CONFIG, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(DEFAULT_CONFIG, indent=2).encode('utf-8')
+    
+    with open(config_path, 'wb') as f:
+        f.write(data)
+    
+    logger.info(f"Created default configuration at {config_path}")
+
 def load_config(config_name: str = 'default') -> Dict[str, Any]:
     """
     Load configuration from a JSON file.
     
+    The parsed configuration is cached, and only read again once the file
+    has been modified. The returned dictionary is shared and must not be
+    modified.
+    
     Args:
         config_name: Name of the configuration file (without extension)
         
@@ -54,65 +192,23 @@ def load_config(config_name: str = 'default') -> Dict[str, Any]:
     """
     config_path = os.path.join(CONFIG_DIR, f"{config_name}.json")
     
-    # Create default config if it doesn't exist
-    if not os.path.exists(config_path):
-        default_config = {
-            'platform_specific': {
-                'windows': {
-                    'commands': {
-                        'setup': 'setup.bat',
-                        'update': 'update.bat',
-                        'run': 'run.bat'
-                    },
-                    'paths': {
-                        'python': 'python',
-                        'npm': 'npm'
-                    }
-                },
-                'linux': {
-                    'commands': {
-                        'setup': './setup.sh',
-                        'update': './update.sh',
-                        'run': './run.sh'
-                    },
-                    'paths': {
-                        'python': 'python3',
-                        'npm': 'npm'
-                    }
-                },
-                'darwin': {
-                    'commands': {
-                        'setup': './setup.sh',
-                        'update': './update.sh',
-                        'run': './run.sh'
-                    },
-                    'paths': {
-                        'python': 'python3',
-                        'npm': 'npm'
-                    }
-                }
-            },
-            'common': {
-                'environment': {
-                    'DEBUG': 'false',
-                    'LOG_LEVEL': 'info'
-                },
-                'paths': {
-                    'data': 'data',
-                    'logs': 'logs'
-                }
-            }
-        }
+    try:
+        try:
+            mtime = os.stat(config_path).st_mtime_ns
+        except FileNotFoundError:
+            # Create default config if it doesn't exist
+            _write_default_config(config_path)
+            mtime = os.stat(config_path).st_mtime_ns
         
-        with open(config_path, 'w') as f:
-            json.dump(default_config, f, indent=2)
+        cached = _CONFIG_CACHE.get(config_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         
-        logger.info(f"Created default configuration at {config_path}")
-    
-    try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        with open(config_path, 'rb') as f:
+            data = f.read()
+        config = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
         
+        _CONFIG_CACHE[config_path] = (mtime, config)
         logger.debug(f"Loaded configuration from {config_path}")
         return config
     except Exception as e:
@@ -123,10 +219,16 @@ def get_platform_config() -> Dict[str, Any]:
     """
     Get platform-specific configuration.
     
+    The merged configuration is cached until the configuration file changes.
+    
     Returns:
         Platform-specific configuration dictionary
     """
+    global _PLATFORM_CONFIG_CACHE
+    
     config = load_config()
+    if _PLATFORM_CONFIG_CACHE is not None and _PLATFORM_CONFIG_CACHE[0] is config:
+        return _PLATFORM_CONFIG_CACHE[1]
     
     platform_config = config.get('platform_specific', {}).get(PLATFORM, {})
     if not platform_config:
@@ -138,57 +240,332 @@ def get_platform_config() -> Dict[str, Any]:
     # Merge platform-specific and common config
     merged_config = {**common_config, **platform_config}
     
+    _PLATFORM_CONFIG_CACHE = (config, merged_config)
     return merged_config
 
-def run_command(command: str, cwd: str = None, env: Dict[str, str] = None) -> int:
+def get_environment() -> Mapping[str, str]:
+    """
+    Get the environment commands are run with.
+    
+    This is the current environment with the common environment variables
+    from the configuration added. It is built once and cached until the
+    configuration file changes; the returned mapping is read-only, so copy
+    it before making changes.
+    
+    Returns:
+        Read-only mapping of environment variables
+    """
+    global _ENVIRONMENT_CACHE
+    
+    config = get_platform_config()
+    if _ENVIRONMENT_CACHE is not None and _ENVIRONMENT_CACHE[0] is config:
+        return _ENVIRONMENT_CACHE[1]
+    
+    env = os.environ.copy()
+    
+    # Add common environment variables
+    env.update(config.get('environment', {}))
+    
+    environment = MappingProxyType(env)
+    _ENVIRONMENT_CACHE = (config, environment)
+    return environment
+
+# Size of the reads used to stream captured command output; this matches
+# the default pipe capacity on Linux, so a single read can drain a full pipe
+OUTPUT_CHUNK_SIZE = 65536
+
+def _read_stream(stream: BinaryIO, buffer: bytearray) -> None:
+    """
+    Read a binary stream to the end, appending its data to a buffer.
+    
+    Args:
+        stream: Stream to read
+        buffer: Buffer to append to
+    """
+    with stream:
+        for chunk in iter(lambda: stream.read1(OUTPUT_CHUNK_SIZE), b''):
+            buffer.extend(chunk)
+
+def _format_command(command: Union[str, List[str]]) -> str:
+    """
+    Format a command for logging.
+    
+    Args:
+        command: Command line, or list of arguments
+        
+    Returns:
+        Command line
+    """
+    return command if isinstance(command, str) else shlex.join(command)
+
+def build_command_argv(command: Union[str, List[str]], env: Optional[Mapping[str, str]] = None) -> List[str]:
+    """
+    Build the argument list used to run a command without a shell.
+    
+    The executable is resolved on the PATH, so that Windows can run it
+    without cmd.exe; batch files are the exception and are run through
+    cmd.exe /c.
+    
+    Args:
+        command: Command line, or list of arguments
+        env: Environment whose PATH is searched (or None for current environment)
+        
+    Returns:
+        List of arguments
+    """
+    if isinstance(command, str):
+        argv = shlex.split(command, posix=not IS_WINDOWS)
+    else:
+        argv = list(command)
+    
+    path = (env if env is not None else os.environ).get('PATH')
+    executable = shutil.which(argv[0], path=path)
+    if executable:
+        argv[0] = executable
+    
+    if IS_WINDOWS and argv[0].lower().endswith(('.bat', '.cmd')):
+        argv = ['cmd.exe', '/c', *argv]
+    
+    return argv
+
+def run_command(
+    command: Union[str, List[str]], cwd: str = None, env: Mapping[str, str] = None, capture: bool = False
+) -> int:
     """
     Run a command in a subprocess.
     
+    By default the command writes straight to this process's stdout and
+    stderr. With capture, its output is read through pipes instead: stdout
+    is copied to this process's stdout and stderr is logged if the command
+    fails.
+    
+    On Linux and macOS the command is started with posix_spawn rather than
+    fork and exec where possible. That needs the working directory left
+    unchanged and inherited file descriptors left open; descriptors
+    opened by Python are not inheritable, so none leak to the command.
+    
     Args:
-        command: Command to run
+        command: Command to run, as a command line or list of arguments
         cwd: Working directory (or None for current directory)
         env: Environment variables (or None for current environment)
+        capture: Whether to read the command's output through pipes
         
     Returns:
         Exit code of the command
     """
-    if not cwd:
-        cwd = os.getcwd()
+    # Only change directory in the child if it would actually be different
+    if cwd and os.path.abspath(cwd) == os.getcwd():
+        cwd = None
     
-    if not env:
-        env = os.environ.copy()
-    
-    logger.info(f"Running command: {command}")
+    logger.info(f"Running command: {_format_command(command)}")
     
     try:
-        # On Windows, use shell=True to run batch files
+        argv = build_command_argv(command, env)
+        
+        if not capture:
+            returncode = subprocess.run(argv, cwd=cwd, env=env, close_fds=IS_WINDOWS, check=False).returncode
+            if returncode != 0:
+                logger.error(f"Command failed with exit code {returncode}")
+            return returncode
+        
         process = subprocess.Popen(
-            command,
-            shell=IS_WINDOWS,
+            argv,
             cwd=cwd,
             env=env,
+            close_fds=IS_WINDOWS,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            universal_newlines=True
+            bufsize=OUTPUT_CHUNK_SIZE
         )
         
-        # Stream output
-        for line in process.stdout:
-            print(line.strip())
+        # Collect stderr on a separate thread, so the command can never block
+        # on a full stderr pipe while stdout is being streamed
+        stderr = bytearray()
+        stderr_reader = threading.Thread(target=_read_stream, args=(process.stderr, stderr), daemon=True)
+        stderr_reader.start()
+        
+        # Stream output in chunks as it arrives
+        with process.stdout:
+            for chunk in iter(lambda: process.stdout.read1(OUTPUT_CHUNK_SIZE), b''):
+                sys.stdout.buffer.write(chunk)
+                sys.stdout.buffer.flush()
         
         # Wait for process to complete
         process.wait()
+        stderr_reader.join()
         
         # Check for errors
         if process.returncode != 0:
-            stderr = process.stderr.read()
-            logger.error(f"Command failed with exit code {process.returncode}: {stderr}")
+            logger.error(
+                f"Command failed with exit code {process.returncode}: "
+                f"{stderr.decode(errors='replace')}"
+            )
         
         return process.returncode
     except Exception as e:
         logger.error(f"Error running command: {e}")
         return 1
 
+def run_pipeline(
+    stages: List[Union[str, List[str]]], cwd: str = None, env: Mapping[str, str] = None
+) -> int:
+    """
+    Run commands as a pipeline, each one reading the previous one's output.
+    
+    The stages are connected by OS pipes, so data passes directly from one
+    command to the next without being copied through this process. The
+    last stage writes straight to this process's stdout.
+    
+    Args:
+        stages: Commands to chain, each as a command line or list of arguments
+        cwd: Working directory (or None for current directory)
+        env: Environment variables (or None for current environment)
+        
+    Returns:
+        0 if every stage succeeded, otherwise the first non-zero exit code;
+        a stage ended by a broken pipe because a later stage stopped reading
+        early is not a failure
+    """
+    if not stages:
+        return 0
+    
+    # Only change directory in the child if it would actually be different
+    if cwd and os.path.abspath(cwd) == os.getcwd():
+        cwd = None
+    
+    logger.info(f"Running pipeline: {' | '.join(_format_command(stage) for stage in stages)}")
+    
+    processes: List[subprocess.Popen] = []
+    try:
+        stdin = None
+        for index, stage in enumerate(stages):
+            is_last = index == len(stages) - 1
+            process = subprocess.Popen(
+                build_command_argv(stage, env),
+                cwd=cwd,
+                env=env,
+                close_fds=IS_WINDOWS,
+                stdin=stdin,
+                stdout=None if is_last else subprocess.PIPE
+            )
+            processes.append(process)
+            
+            # The next stage holds the only read end, so the previous stage
+            # sees a broken pipe if its reader exits early
+            if stdin is not None:
+                stdin.close()
+            stdin = process.stdout
+    except Exception as e:
+        logger.error(f"Error running pipeline: {e}")
+        for process in processes:
+            if process.stdout:
+                process.stdout.close()
+            process.kill()
+            process.wait()
+        return 1
+    
+    returncodes = [process.wait() for process in processes]
+    for index, (stage, returncode) in enumerate(zip(stages, returncodes)):
+        if returncode == 0:
+            continue
+        if not IS_WINDOWS and index < len(stages) - 1 and returncode == -signal.SIGPIPE:
+            continue
+        logger.error(f"Pipeline stage failed with exit code {returncode}: {_format_command(stage)}")
+        return returncode
+    
+    return 0
+
+def run_commands(
+    commands: List[Union[str, List[str]]], cwd: str = None, env: Mapping[str, str] = None
+) -> int:
+    """
+    Run independent commands concurrently.
+    
+    Every command is run to completion, even if another one fails.
+    
+    Args:
+        commands: Commands to run, each as a command line or list of arguments
+        cwd: Working directory (or None for current directory)
+        env: Environment variables (or None for current environment)
+        
+    Returns:
+        0 if every command succeeded, otherwise the first non-zero exit code
+    """
+    if len(commands) <= 1:
+        return run_command(commands[0], cwd=cwd, env=env) if commands else 0
+    
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        futures = [executor.submit(run_command, command, cwd=cwd, env=env) for command in commands]
+        returncodes = [future.result() for future in futures]
+    
+    return next((returncode for returncode in returncodes if returncode != 0), 0)
+
+def _is_current_python(python_cmd: str) -> bool:
+    """
+    Check whether a Python command runs the interpreter running this script.
+    
+    Args:
+        python_cmd: Python command from the configuration
+        
+    Returns:
+        True if the command resolves to this interpreter
+    """
+    executable = shutil.which(python_cmd)
+    if not executable or not sys.executable:
+        return False
+    
+    return os.path.realpath(executable) == os.path.realpath(sys.executable)
+
+def requirements_satisfied(requirements_path: str) -> bool:
+    """
+    Check whether every requirement in a requirements file is installed.
+    
+    Only plain requirement lines are understood; anything else, such as
+    pip options, editable installs or extras, makes the check fail so that
+    pip is run as usual. The check also fails if packaging is unavailable.
+    
+    Args:
+        requirements_path: Path of the requirements file
+        
+    Returns:
+        True if every requirement is installed in this interpreter
+    """
+    if not PACKAGING_AVAILABLE:
+        return False
+    
+    try:
+        with open(requirements_path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    except OSError as e:
+        logger.warning(f"Error reading requirements: {e}")
+        return False
+    
+    for line in lines:
+        line = line.split(' #', 1)[0].strip()
+        if not line or line.startswith('#'):
+            continue
+        
+        try:
+            requirement = Requirement(line)
+        except InvalidRequirement:
+            return False
+        
+        if requirement.extras or requirement.url:
+            return False
+        
+        if requirement.marker is not None and not requirement.marker.evaluate():
+            continue
+        
+        try:
+            installed_version = importlib.metadata.version(requirement.name)
+        except importlib.metadata.PackageNotFoundError:
+            return False
+        
+        if not requirement.specifier.contains(installed_version, prereleases=True):
+            return False
+    
+    return True
+
 def setup(args: argparse.Namespace) -> int:
     """
     Set up the project.
@@ -202,12 +579,10 @@ def setup(args: argparse.Namespace) -> int:
     logger.info("Setting up project...")
     
     config = get_platform_config()
-    env = os.environ.copy()
+    env = get_environment()
     
-    # Add common environment variables
-    if 'environment' in config:
-        for key, value in config['environment'].items():
-            env[key] = value
+    # Python and Node.js are independent, so their installs run concurrently
+    commands: List[Union[str, List[str]]] = []
     
     # Python setup
     if args.with_python:
@@ -215,12 +590,12 @@ def setup(args: argparse.Namespace) -> int:
         
         python_cmd = config.get('paths', {}).get('python', 'python3')
         
-        # Install requirements
-        requirements_path = os.path.join(PROJECT_ROOT, 'requirements.txt')
-        if os.path.exists(requirements_path):
-            cmd = f"{python_cmd} -m pip install -r {requirements_path}"
-            if run_command(cmd, cwd=PROJECT_ROOT, env=env) != 0:
-                return 1
+        # Install requirements, unless they are all installed already
+        if _exists(REQUIREMENTS_TXT):
+            if _is_current_python(python_cmd) and requirements_satisfied(REQUIREMENTS_TXT):
+                logger.info("Python requirements are already satisfied")
+            else:
+                commands.append([python_cmd, '-m', 'pip', 'install', '-r', REQUIREMENTS_TXT])
     
     # Node.js setup
     if args.with_node:
@@ -229,11 +604,11 @@ def setup(args: argparse.Namespace) -> int:
         npm_cmd = config.get('paths', {}).get('npm', 'npm')
         
         # Install dependencies
-        package_json_path = os.path.join(PROJECT_ROOT, 'package.json')
-        if os.path.exists(package_json_path):
-            cmd = f"{npm_cmd} install"
-            if run_command(cmd, cwd=PROJECT_ROOT, env=env) != 0:
-                return 1
+        if _exists(PACKAGE_JSON):
+            commands.append([npm_cmd, 'install'])
+    
+    if run_commands(commands, cwd=PROJECT_ROOT, env=env) != 0:
+        return 1
     
     # Create directories
     for dir_name in ['data', 'logs']:
@@ -246,11 +621,11 @@ def setup(args: argparse.Namespace) -> int:
         logger.info("Initializing security module...")
         
         try:
-            sys.path.append(PROJECT_ROOT)
-            import security
-            security.initialize()
-        except ImportError:
-            logger.error("Security module not found")
+            security = _load_security_module()
+            if security is None:
+                logger.error("Security module not found")
+            else:
+                security.initialize()
         except Exception as e:
             logger.error(f"Error initializing security module: {e}")
             return 1
@@ -280,12 +655,10 @@ def update(args: argparse.Namespace) -> int:
     logger.info("Updating project...")
     
     config = get_platform_config()
-    env = os.environ.copy()
+    env = get_environment()
     
-    # Add common environment variables
-    if 'environment' in config:
-        for key, value in config['environment'].items():
-            env[key] = value
+    # Python and Node.js are independent, so their updates run concurrently
+    commands: List[Union[str, List[str]]] = []
     
     # Python update
     if args.with_python:
@@ -294,11 +667,8 @@ def update(args: argparse.Namespace) -> int:
         python_cmd = config.get('paths', {}).get('python', 'python3')
         
         # Update requirements
-        requirements_path = os.path.join(PROJECT_ROOT, 'requirements.txt')
-        if os.path.exists(requirements_path):
-            cmd = f"{python_cmd} -m pip install -r {requirements_path} --upgrade"
-            if run_command(cmd, cwd=PROJECT_ROOT, env=env) != 0:
-                return 1
+        if _exists(REQUIREMENTS_TXT):
+            commands.append([python_cmd, '-m', 'pip', 'install', '-r', REQUIREMENTS_TXT, '--upgrade'])
     
     # Node.js update
     if args.with_node:
@@ -307,11 +677,11 @@ def update(args: argparse.Namespace) -> int:
         npm_cmd = config.get('paths', {}).get('npm', 'npm')
         
         # Update dependencies
-        package_json_path = os.path.join(PROJECT_ROOT, 'package.json')
-        if os.path.exists(package_json_path):
-            cmd = f"{npm_cmd} update"
-            if run_command(cmd, cwd=PROJECT_ROOT, env=env) != 0:
-                return 1
+        if _exists(PACKAGE_JSON):
+            commands.append([npm_cmd, 'update'])
+    
+    if run_commands(commands, cwd=PROJECT_ROOT, env=env) != 0:
+        return 1
     
     # Run platform-specific update
     if args.platform_specific:
@@ -338,12 +708,7 @@ def run(args: argparse.Namespace) -> int:
     logger.info("Running project...")
     
     config = get_platform_config()
-    env = os.environ.copy()
-    
-    # Add common environment variables
-    if 'environment' in config:
-        for key, value in config['environment'].items():
-            env[key] = value
+    env = get_environment()
     
     # Use run command from config or default to Python app.py
     run_cmd = config.get('commands', {}).get('run')
@@ -352,7 +717,18 @@ def run(args: argparse.Namespace) -> int:
         run_cmd = f"{python_cmd} app.py"
     
     # Run the command
-    return run_command(run_cmd, cwd=PROJECT_ROOT, env=env)
+    if IS_WINDOWS:
+        return run_command(run_cmd, cwd=PROJECT_ROOT, env=env)
+    
+    # Nothing is left to do afterwards, so replace this process with the command
+    logger.info(f"Running command: {run_cmd}")
+    argv = shlex.split(run_cmd)
+    try:
+        os.chdir(PROJECT_ROOT)
+        os.execvpe(argv[0], argv, env)
+    except OSError as e:
+        logger.error(f"Error running command: {e}")
+        return 1
 
 def main():
     """Main entry point."""
@@ -378,6 +754,10 @@ def main():
     # Parse arguments
     args = parser.parse_args()
     
+    # Commands run from the project root; running from there already lets
+    # them be started without changing directory
+    os.chdir(PROJECT_ROOT)
+    
     # Run command
     if args.command == 'setup':
         return setup(args)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for the requirements check of the cross-platform setup script.
+"""
+import unittest
+import os
+import sys
+import logging
+import tempfile
+import importlib.metadata
+
+# Adjust path to import from the scripts directory
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+import cross_platform
+
+# Disable logging during tests
+logging.disable(logging.CRITICAL)
+
+# A package that is always installed while the tests run
+INSTALLED = 'packaging'
+INSTALLED_VERSION = importlib.metadata.version(INSTALLED)
+
+
+@unittest.skipUnless(cross_platform.PACKAGING_AVAILABLE, "packaging is not installed")
+class TestRequirementsSatisfied(unittest.TestCase):
+    """Test cases for requirements_satisfied."""
+
+    def setUp(self):
+        """Create a scratch directory for requirements files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def satisfied(self, *lines):
+        """Write a requirements file with the given lines and check it."""
+        path = os.path.join(self.temp_dir.name, 'requirements.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        return cross_platform.requirements_satisfied(path)
+
+    def test_installed_requirements_are_satisfied(self):
+        """Test requirements that are installed, with and without versions."""
+        self.assertTrue(self.satisfied(INSTALLED))
+        self.assertTrue(self.satisfied(f'{INSTALLED}=={INSTALLED_VERSION}'))
+        self.assertTrue(self.satisfied(f'{INSTALLED}>=1.0'))
+
+    def test_comments_and_blank_lines_are_ignored(self):
+        """Test that comments and blank lines do not affect the check."""
+        self.assertTrue(self.satisfied('# Requirements', '', f'{INSTALLED}>=1.0  # Used to parse requirements'))
+        self.assertTrue(self.satisfied('# only comments'))
+
+    def test_missing_requirement_is_not_satisfied(self):
+        """Test that a requirement that is not installed fails the check."""
+        self.assertFalse(self.satisfied(INSTALLED, 'no-such-package-for-tests'))
+
+    def test_version_out_of_range_is_not_satisfied(self):
+        """Test that an installed version outside the specifier fails the check."""
+        self.assertFalse(self.satisfied(f'{INSTALLED}<1.0'))
+        self.assertFalse(self.satisfied(f'{INSTALLED}!={INSTALLED_VERSION}'))
+
+    def test_markers_are_evaluated(self):
+        """Test that requirements whose marker does not apply are skipped."""
+        self.assertTrue(self.satisfied('no-such-package-for-tests; python_version < "3"'))
+        self.assertFalse(self.satisfied('no-such-package-for-tests; python_version >= "3"'))
+
+    def test_unsupported_lines_are_not_satisfied(self):
+        """Test that pip options, editable installs and extras make pip run."""
+        self.assertFalse(self.satisfied('-e .'))
+        self.assertFalse(self.satisfied('-r other-requirements.txt'))
+        self.assertFalse(self.satisfied(f'{INSTALLED}[extra]'))
+        self.assertFalse(self.satisfied(f'{INSTALLED} @ https://example.com/{INSTALLED}.whl'))
+
+    def test_unreadable_file_is_not_satisfied(self):
+        """Test that a missing requirements file fails the check."""
+        missing = os.path.join(self.temp_dir.name, 'missing.txt')
+        self.assertFalse(cross_platform.requirements_satisfied(missing))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-memory log buffer of the logging plugin.
+"""
+import unittest
+import os
+import sys
+import logging
+import tempfile
+import threading
+from datetime import datetime
+
+# Adjust path to import from parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from myproject.plugins.examples.logging_plugin import LoggingPlugin
+
+# Time of the first test record, in seconds since the epoch
+BASE_TIME = 1_700_000_000
+
+
+def make_record(offset, message, level=logging.INFO):
+    """Create a log record created offset seconds after BASE_TIME."""
+    record = logging.LogRecord("test", level, __file__, 1, message, None, None)
+    record.created = BASE_TIME + offset
+    return record
+
+
+def iso(offset):
+    """Get the ISO timestamp offset seconds after BASE_TIME."""
+    return datetime.fromtimestamp(BASE_TIME + offset).isoformat()
+
+
+class TestLogBuffer(unittest.TestCase):
+    """Test cases for get_logs filtering."""
+
+    def setUp(self):
+        """Create a plugin with ten buffered records, alternating INFO and ERROR."""
+        self.plugin = LoggingPlugin()
+        for i in range(10):
+            level = logging.ERROR if i % 2 else logging.INFO
+            self.plugin.add_log_entry(make_record(i, f"message {i}", level))
+
+    def messages(self, **filters):
+        """Get the messages of the entries get_logs returns."""
+        return [entry["message"] for entry in self.plugin.get_logs(**filters)]
+
+    def test_unfiltered_returns_newest_entries_in_order(self):
+        """Test that without filters the newest entries are returned, oldest first."""
+        self.assertEqual(self.messages(limit=3), ["message 7", "message 8", "message 9"])
+        self.assertEqual(len(self.messages()), 10)
+
+    def test_time_window_is_inclusive(self):
+        """Test filtering by start and end time."""
+        self.assertEqual(
+            self.messages(start_time=iso(2), end_time=iso(5)),
+            ["message 2", "message 3", "message 4", "message 5"]
+        )
+        self.assertEqual(self.messages(start_time=iso(8)), ["message 8", "message 9"])
+        self.assertEqual(self.messages(end_time=iso(1)), ["message 0", "message 1"])
+        self.assertEqual(self.messages(start_time=iso(20)), [])
+
+    def test_level_filter_applies_limit_to_newest_matches(self):
+        """Test that the level filter keeps the newest matching entries."""
+        self.assertEqual(self.messages(level="error", limit=2), ["message 7", "message 9"])
+        self.assertEqual(
+            self.messages(level="INFO", start_time=iso(1), end_time=iso(6)),
+            ["message 2", "message 4", "message 6"]
+        )
+
+    def test_unknown_level_returns_nothing(self):
+        """Test that an unknown level returns no entries."""
+        self.assertEqual(self.messages(level="no-such-level"), [])
+
+    def test_non_positive_limit_returns_all_matches(self):
+        """Test that a limit of zero or less means no limit."""
+        self.assertEqual(self.messages(limit=0), [f"message {i}" for i in range(10)])
+        self.assertEqual(self.messages(limit=-1, start_time=iso(7)), ["message 7", "message 8", "message 9"])
+        self.assertEqual(self.messages(level="error", limit=0), ["message 1", "message 3", "message 5", "message 7", "message 9"])
+
+    def test_out_of_order_entries_are_not_dropped(self):
+        """Test the time window when records arrive out of time order."""
+        self.plugin.add_log_entry(make_record(3.5, "late"))
+        self.plugin.add_log_entry(make_record(10, "message 10"))
+
+        self.assertEqual(
+            self.messages(start_time=iso(3), end_time=iso(4)),
+            ["message 3", "message 4", "late"]
+        )
+        self.assertEqual(self.messages(start_time=iso(10)), ["message 10"])
+
+    def test_order_is_restored_once_out_of_order_entries_are_dropped(self):
+        """Test that bisection is used again once the buffer is back in order."""
+        self.plugin.add_log_entry(make_record(3.5, "late"))
+        self.assertNotEqual(self.plugin._log_time_inversions, 0)
+
+        # The buffer holds 1000 entries, so these push the late entry out
+        for i in range(1000):
+            self.plugin.add_log_entry(make_record(100 + i, f"new {i}"))
+
+        self.assertEqual(self.plugin._log_time_inversions, 0)
+        self.assertEqual(self.messages(start_time=iso(100), end_time=iso(101)), ["new 0", "new 1"])
+
+
+class TestConcurrentLogging(unittest.TestCase):
+    """Test that the buffer can be read while other threads are logging."""
+
+    def test_get_logs_and_export_while_logging(self):
+        """Test that reads never fail with 'deque mutated during iteration'."""
+        plugin = LoggingPlugin()
+        stop = threading.Event()
+
+        def log_continuously():
+            i = 0
+            while not stop.is_set():
+                plugin.add_log_entry(make_record(i, f"message {i}", logging.ERROR if i % 3 else logging.INFO))
+                i += 1
+
+        writer = threading.Thread(target=log_continuously)
+        writer.start()
+        try:
+            with tempfile.TemporaryDirectory() as export_dir:
+                for i in range(300):
+                    plugin.get_logs(limit=50)
+                    plugin.get_logs(level="error", limit=50)
+                    plugin.get_logs(start_time=iso(0), limit=1000)
+                    if i % 30 == 0:
+                        for export_format in ("json", "csv", "text"):
+                            path = os.path.join(export_dir, f"export.{export_format}")
+                            self.assertEqual(plugin.export_logs(export_format, path), path)
+        finally:
+            stop.set()
+            writer.join()
+
+        self.assertEqual(len(plugin._log_entries), len(plugin._log_times))
+        self.assertEqual(len(plugin._log_entries), len(plugin._log_levels))
+
+
+
+class TestConcurrentEntryReads(unittest.TestCase):
+    """Test reading a log entry for the first time from several threads at once."""
+
+    def test_message_first_read(self):
+        """Test that concurrent first reads of a message all get the formatted message."""
+        readers = 8
+        converting = threading.Barrier(readers)
+
+        class Template:
+            """A message whose conversion to text waits until every reader is converting it."""
+
+            def __str__(self):
+                converting.wait(5)
+                return "message %d of %s"
+
+        plugin = LoggingPlugin()
+        plugin.add_log_entry(logging.LogRecord("test", logging.INFO, __file__, 1, Template(), (1, "test"), None))
+        entry = plugin._log_entries[0]
+
+        messages = []
+        threads = [threading.Thread(target=lambda: messages.append(entry.message)) for _ in range(readers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(messages, ["message 1 of test"] * readers)
+        self.assertEqual(entry.message, "message 1 of test")
+
+
+if __name__ == "__main__":
+    unittest.main()
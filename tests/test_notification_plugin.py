@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-memory notification buffer of the notification plugin.
+"""
+import unittest
+import os
+import sys
+import logging
+
+# Adjust path to import from parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from myproject.plugins.examples.notification_plugin import NotificationPlugin
+
+# Disable logging during tests
+logging.disable(logging.CRITICAL)
+
+
+class TestNotificationBuffer(unittest.TestCase):
+    """Test cases for get_notifications filtering."""
+
+    def setUp(self):
+        """Create a plugin with six stored notifications, alternating info and error."""
+        self.plugin = NotificationPlugin()
+        for i in range(6):
+            self.plugin._store_notification({
+                "id": str(i),
+                "timestamp": f"2024-01-01T00:00:0{i}",
+                "subject": "Test",
+                "message": f"notification {i}",
+                "level": "error" if i % 2 else "info"
+            })
+
+    def messages(self, **filters):
+        """Get the messages of the notifications get_notifications returns."""
+        return [notification["message"] for notification in self.plugin.get_notifications(**filters)]
+
+    def test_limit_returns_newest_notifications_in_order(self):
+        """Test that the limit keeps the newest notifications, oldest first."""
+        self.assertEqual(self.messages(limit=2), ["notification 4", "notification 5"])
+        self.assertEqual(self.messages(level="info", limit=2), ["notification 2", "notification 4"])
+
+    def test_non_positive_limit_returns_all_matches(self):
+        """Test that a limit of zero or less means no limit."""
+        self.assertEqual(self.messages(limit=0), [f"notification {i}" for i in range(6)])
+        self.assertEqual(self.messages(level="error", limit=-1), ["notification 1", "notification 3", "notification 5"])
+        self.assertEqual(
+            self.messages(limit=0, start_time="2024-01-01T00:00:02", end_time="2024-01-01T00:00:03"),
+            ["notification 2", "notification 3"]
+        )
+
+    def test_empty_buffer(self):
+        """Test that an empty buffer returns no notifications for any limit."""
+        plugin = NotificationPlugin()
+        self.assertEqual(plugin.get_notifications(limit=0), [])
+        self.assertEqual(plugin.get_notifications(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Tests for loading, migrating and reading plugin registry data.
+"""
+import unittest
+import os
+import sys
+import json
+import logging
+import tempfile
+from unittest.mock import patch
+
+# Adjust path to import from parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from myproject.plugins.custom.PluginRegistry import (
+    LEGACY_REGISTRY_FILES,
+    REGISTRY_FILE,
+    PluginRegistryPlugin,
+    UsageStats,
+    plugin_manager
+)
+
+# Disable logging during tests
+logging.disable(logging.CRITICAL)
+
+# Registry sections as written by older versions, one file per section
+LEGACY_DATA = {
+    "metadata": {
+        "test_plugin": {
+            "name": "test_plugin",
+            "version": "1.0.0",
+            "category": "utility",
+            "health_status": "healthy",
+            "homepage": "https://example.com"
+        }
+    },
+    "usage": {
+        "test_plugin": {
+            "load_count": 2,
+            "usage_count": 5,
+            "error_count": 1,
+            "performance": {"avg_response_time": 0.25, "samples": 4}
+        }
+    },
+    "integration": {"dashboard": ["test_plugin"]},
+    "hooks": {"plugin_loaded": {"test_plugin": {"handler": "on_plugin_loaded"}}}
+}
+
+
+class TestUsageStats(unittest.TestCase):
+    """Test cases for serializing usage statistics."""
+
+    def test_response_time_is_kept_in_nanoseconds(self):
+        """Test that response times are read as integer nanoseconds and written as seconds."""
+        stats = UsageStats.from_dict(LEGACY_DATA["usage"]["test_plugin"])
+
+        self.assertEqual(stats.avg_response_time_ns, 250_000_000)
+        self.assertIsInstance(stats.avg_response_time_ns, int)
+        self.assertEqual(stats.samples, 4)
+        self.assertEqual(stats.usage_count, 5)
+        self.assertEqual(stats.to_dict()["performance"], {"avg_response_time": 0.25, "samples": 4})
+
+    def test_response_time_saved_in_nanoseconds_is_read(self):
+        """Test reading registries saved with the average in nanoseconds."""
+        stats = UsageStats.from_dict({"performance": {"avg_response_time_ns": 1500.4, "samples": 2}})
+
+        self.assertEqual(stats.avg_response_time_ns, 1500)
+        self.assertEqual(stats.to_dict()["performance"]["avg_response_time"], 1.5e-06)
+
+    def test_round_trip(self):
+        """Test that to_dict and from_dict preserve the statistics."""
+        stats = UsageStats(load_count=1, usage_count=3, avg_response_time_ns=1500, samples=2)
+
+        self.assertEqual(UsageStats.from_dict(stats.to_dict()), stats)
+
+
+class TestRegistryData(unittest.TestCase):
+    """Test cases for registry persistence and the public getters."""
+
+    def setUp(self):
+        """Create a registry that stores its data in a scratch directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.registry = PluginRegistryPlugin()
+        self.registry._registry_data_dir = self.temp_dir.name
+
+    def write_legacy_files(self):
+        """Write each registry section to its legacy file."""
+        for section, filename in LEGACY_REGISTRY_FILES.items():
+            with open(os.path.join(self.temp_dir.name, filename), "w", encoding="utf-8") as f:
+                json.dump(LEGACY_DATA[section], f)
+
+    def load(self):
+        """Load registry data from disk without checking loaded plugins."""
+        self.registry._load_registry_data()
+        self.registry._loaded = True
+
+    def test_legacy_files_are_migrated(self):
+        """Test that legacy section files are loaded and saved as one registry file."""
+        self.write_legacy_files()
+        self.load()
+
+        self.assertTrue(all(self.registry._dirty.values()))
+        self.assertEqual(self.registry.get_plugin_metadata("test_plugin")["version"], "1.0.0")
+        self.assertEqual(self.registry.get_all_integration_points()["dashboard"], frozenset({"test_plugin"}))
+
+        self.registry._save_registry_data()
+
+        self.assertFalse(any(self.registry._dirty.values()))
+        with open(os.path.join(self.temp_dir.name, REGISTRY_FILE), encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(data["integration"], LEGACY_DATA["integration"])
+        self.assertEqual(data["hooks"], LEGACY_DATA["hooks"])
+        self.assertEqual(data["metadata"]["test_plugin"]["homepage"], "https://example.com")
+        self.assertEqual(data["usage"]["test_plugin"]["performance"], {"avg_response_time": 0.25, "samples": 4})
+
+    def test_registry_file_is_preferred_over_legacy_files(self):
+        """Test that saved registry data is loaded without being marked modified."""
+        self.write_legacy_files()
+        with open(os.path.join(self.temp_dir.name, REGISTRY_FILE), "w", encoding="utf-8") as f:
+            json.dump({"integration": {"api": ["other_plugin"]}}, f)
+
+        self.load()
+
+        self.assertFalse(any(self.registry._dirty.values()))
+        self.assertEqual(dict(self.registry.get_all_integration_points()), {"api": frozenset({"other_plugin"})})
+        self.assertIsNone(self.registry.get_plugin_metadata("test_plugin"))
+
+    def test_getters_return_copies(self):
+        """Test that changing a returned dictionary does not change the registry."""
+        self.write_legacy_files()
+        self.load()
+
+        metadata = self.registry.get_plugin_metadata("test_plugin")
+        metadata["version"] = "2.0.0"
+        self.registry.get_all_plugin_metadata()["test_plugin"]["category"] = "other"
+        stats = self.registry.get_plugin_usage_stats("test_plugin")
+        stats["usage_count"] = 0
+
+        self.assertEqual(self.registry.get_plugin_metadata("test_plugin")["version"], "1.0.0")
+        self.assertEqual(self.registry.get_plugin_metadata("test_plugin")["category"], "utility")
+        self.assertEqual(self.registry.get_all_usage_stats()["test_plugin"]["usage_count"], 5)
+        self.assertEqual(self.registry.get_plugin_usage_stats("test_plugin")["performance"]["avg_response_time"], 0.25)
+        self.assertIsNone(self.registry.get_plugin_usage_stats("missing_plugin"))
+
+    def test_integration_points_are_read_only(self):
+        """Test that integration points cannot be changed through the getter."""
+        self.write_legacy_files()
+        self.load()
+
+        integration_points = self.registry.get_all_integration_points()
+        with self.assertRaises(TypeError):
+            integration_points["api"] = frozenset()
+        self.assertIsInstance(integration_points["dashboard"], frozenset)
+
+        with patch.object(plugin_manager, "get_plugin", return_value=object()):
+            self.assertTrue(self.registry.register_integration_point("test_plugin", "api"))
+        self.assertNotIn("api", integration_points)
+        self.assertEqual(self.registry.get_all_integration_points()["api"], frozenset({"test_plugin"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
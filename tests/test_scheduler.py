@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Tests for the task runner and schedules of the dashboard update scheduler.
+"""
+import unittest
+import os
+import sys
+import logging
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+# Adjust path to import from parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The scheduler logs to files under ./logs, so import it from a scratch directory
+_original_cwd = os.getcwd()
+_log_root = tempfile.mkdtemp()
+os.makedirs(os.path.join(_log_root, 'logs'))
+os.chdir(_log_root)
+try:
+    import scheduledashboardupdate as scheduler
+finally:
+    os.chdir(_original_cwd)
+
+# Disable logging during tests
+logging.disable(logging.CRITICAL)
+
+
+def wait_until(condition, timeout=5):
+    """Wait for a condition to become true, returning whether it did."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestTaskRunner(unittest.TestCase):
+    """Test cases for the priority task runner."""
+
+    def setUp(self):
+        """Replace task execution with a recorder that can hold a task running."""
+        self.started = []
+        self.release = threading.Event()
+        self.blocker_running = threading.Event()
+        self.finished = threading.Event()
+
+        def execute_task(task):
+            self.started.append(task['name'])
+            if task['name'] == 'blocker':
+                self.blocker_running.set()
+                self.release.wait(5)
+            if task['name'] == 'last':
+                self.finished.set()
+
+        patcher = patch.object(scheduler, 'execute_task', execute_task)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.runner = scheduler.TaskRunner(1)
+        self.addCleanup(self.runner.shutdown)
+        self.addCleanup(self.release.set)
+
+    def start_blocker(self):
+        """Occupy the only worker until release is set."""
+        self.assertTrue(self.runner.submit({'name': 'blocker', 'priority': 'high'}))
+        self.assertTrue(self.blocker_running.wait(5))
+
+    def test_tasks_run_by_priority_then_submission_order(self):
+        """Test that queued tasks run highest priority first."""
+        self.start_blocker()
+        self.runner.submit({'name': 'low', 'priority': 'low'})
+        self.runner.submit({'name': 'medium 1'})
+        self.runner.submit({'name': 'high', 'priority': 'high'})
+        self.runner.submit({'name': 'medium 2', 'priority': 'medium'})
+        self.runner.submit({'name': 'last', 'priority': 'low'})
+
+        self.release.set()
+        self.assertTrue(self.finished.wait(5))
+        self.assertEqual(self.started, ['blocker', 'high', 'medium 1', 'medium 2', 'low', 'last'])
+
+    def test_task_is_not_queued_twice(self):
+        """Test that a task already queued or running is skipped."""
+        self.start_blocker()
+        self.assertFalse(self.runner.submit({'name': 'blocker'}))
+        self.assertTrue(self.runner.submit({'name': 'last'}))
+        self.assertFalse(self.runner.submit({'name': 'last'}))
+
+        self.release.set()
+        self.assertTrue(self.finished.wait(5))
+        self.assertEqual(self.started, ['blocker', 'last'])
+
+        # Once a run has finished the task can be queued again
+        self.assertTrue(wait_until(lambda: 'last' not in self.runner._active))
+        self.finished.clear()
+        self.assertTrue(self.runner.submit({'name': 'last'}))
+        self.assertTrue(self.finished.wait(5))
+
+    def test_shutdown_drops_queued_tasks_and_stops_workers(self):
+        """Test that shutdown lets the running task finish and drops the rest."""
+        self.start_blocker()
+        self.runner.submit({'name': 'queued'})
+
+        self.runner.shutdown()
+        self.release.set()
+        for worker in self.runner._workers:
+            worker.join(5)
+            self.assertFalse(worker.is_alive())
+
+        self.assertEqual(self.started, ['blocker'])
+
+        # Dropped tasks are no longer considered queued
+        self.assertNotIn('queued', self.runner._active)
+
+
+class TestMiniScheduler(unittest.TestCase):
+    """Test cases for the heap-based job scheduler."""
+
+    def setUp(self):
+        """Create an empty scheduler and a list recording job runs."""
+        self.scheduler = scheduler.MiniScheduler()
+        self.runs = []
+
+    def test_due_job_runs_and_is_rescheduled(self):
+        """Test that a due job runs once and is scheduled for its next run."""
+        calls = []
+
+        def next_run(after):
+            calls.append(after)
+            # Due straight away the first time, an hour later afterwards
+            return after - timedelta(seconds=1) if len(calls) == 1 else after + timedelta(hours=1)
+
+        self.scheduler.add(next_run, lambda: self.runs.append('job'))
+        self.scheduler.run_pending()
+        self.scheduler.run_pending()
+
+        self.assertEqual(self.runs, ['job'])
+        self.assertGreater(self.scheduler.idle_seconds(), 3500)
+
+    def test_jobs_run_in_time_order(self):
+        """Test that due jobs run earliest first."""
+        now = datetime.now()
+        self.scheduler.call_at(now - timedelta(seconds=1), lambda: self.runs.append('second'), key='b')
+        self.scheduler.call_at(now - timedelta(seconds=2), lambda: self.runs.append('first'), key='a')
+        self.scheduler.call_at(now + timedelta(hours=1), lambda: self.runs.append('later'), key='c')
+
+        self.scheduler.run_pending()
+
+        self.assertEqual(self.runs, ['first', 'second'])
+
+    def test_call_at_runs_once_per_key(self):
+        """Test that one-off jobs are not duplicated and run only once."""
+        due = datetime.now() - timedelta(seconds=1)
+        self.assertTrue(self.scheduler.call_at(due, lambda: self.runs.append('test'), key='task'))
+        self.assertFalse(self.scheduler.call_at(due, lambda: self.runs.append('duplicate'), key='task'))
+
+        self.scheduler.run_pending()
+        self.scheduler.run_pending()
+        self.assertEqual(self.runs, ['test'])
+        self.assertIsNone(self.scheduler.idle_seconds())
+
+        # The key can be used again once its job has run
+        self.assertTrue(self.scheduler.call_at(due, lambda: self.runs.append('again'), key='task'))
+
+    def test_clear_removes_all_jobs(self):
+        """Test that clear removes recurring and one-off jobs."""
+        self.scheduler.add(lambda after: after + timedelta(hours=1), lambda: None)
+        self.scheduler.call_at(datetime.now(), lambda: None, key='task')
+
+        self.scheduler.clear()
+
+        self.assertIsNone(self.scheduler.idle_seconds())
+        self.assertTrue(self.scheduler.call_at(datetime.now(), lambda: None, key='task'))
+
+
+class TestTaskSchedules(unittest.TestCase):
+    """Test cases for parsing schedules and computing next run times."""
+
+    def test_parse_schedule(self):
+        """Test the supported schedule formats."""
+        self.assertEqual(scheduler.parse_schedule('hourly'), ('hourly', None))
+        self.assertEqual(scheduler.parse_schedule('daily'), ('daily', None))
+        self.assertEqual(scheduler.parse_schedule('weekly'), ('weekly', None))
+        self.assertEqual(scheduler.parse_schedule('*/15 * * * *'), ('every_minutes', 15))
+        self.assertEqual(scheduler.parse_schedule('30 2 * * *'), ('hour_at', 30))
+
+    def test_parse_schedule_rejects_unsupported_schedules(self):
+        """Test that unsupported schedules raise ValueError."""
+        for schedule in ('sometimes', '*/0 * * * *', '60 * * * *', '*/5 * * *', '1-5 * * * *'):
+            with self.subTest(schedule=schedule):
+                with self.assertRaises(ValueError):
+                    scheduler.parse_schedule(schedule)
+
+    def test_compile_task_schedule_defaults(self):
+        """Test that tasks default to daily, and to hourly if their schedule is invalid."""
+        self.assertEqual(scheduler.compile_task_schedule({'name': 'task'}), ('daily', None))
+        self.assertEqual(scheduler.compile_task_schedule({'name': 'task', 'schedule': 'bogus'}), ('hourly', None))
+
+    def test_next_run_times(self):
+        """Test the next run time computed for each schedule kind."""
+        next_run = scheduler.SCHEDULE_NEXT_RUN
+        wednesday = datetime(2024, 1, 3, 13, 45, 30)
+        monday = datetime(2024, 1, 8, 9, 0)
+
+        self.assertEqual(next_run['hourly'](None, wednesday), datetime(2024, 1, 3, 14, 45, 30))
+        self.assertEqual(next_run['daily'](None, wednesday), datetime(2024, 1, 4))
+        self.assertEqual(next_run['daily'](None, datetime(2024, 12, 31, 23, 59)), datetime(2025, 1, 1))
+        self.assertEqual(next_run['weekly'](None, wednesday), datetime(2024, 1, 8))
+        self.assertEqual(next_run['weekly'](None, monday), datetime(2024, 1, 15))
+        self.assertEqual(next_run['every_minutes'](15, wednesday), datetime(2024, 1, 3, 14, 0, 30))
+
+    def test_next_hour_at(self):
+        """Test that minute-of-hour schedules always move forward."""
+        self.assertEqual(scheduler.next_hour_at(50, datetime(2024, 1, 3, 13, 45, 30)), datetime(2024, 1, 3, 13, 50))
+        self.assertEqual(scheduler.next_hour_at(45, datetime(2024, 1, 3, 13, 45)), datetime(2024, 1, 3, 14, 45))
+        self.assertEqual(scheduler.next_hour_at(30, datetime(2024, 1, 3, 23, 45)), datetime(2024, 1, 4, 0, 30))
+
+
+if __name__ == '__main__':
+    unittest.main()